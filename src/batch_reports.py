@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Render the standings reports of many leagues in one process
+
+Each league is either a directory laid out like this repository
+(data/ownersStandingsOverall.csv and data/ownersStandings.csv, rendered to
+index.html) or an entry in a JSON manifest. All leagues share the imports and
+the compiled report template; with --jobs N they are spread over a process
+pool whose workers compile the template once each.
+
+With --assets-dir DIR the stylesheet and script are written once to DIR as
+content-hashed report.<hash>.css/js files that every page references (so they
+can be cached long-term) instead of being inlined into each page; the vendored
+Chart.js copy goes there too.
+
+With --lazy-data each page's chart data is written to <page>.data/*.json and
+fetched when the chart scrolls into view (--gzip adds precompressed copies).
+
+Chart.js is loaded with its integrity hash; --no-integrity leaves it off, for
+pages that will be opened from disk rather than served over HTTP.
+
+A manifest is a JSON list of objects with the ReportConfig fields
+(league_name, emoji, overall_csv, detailed_csv, output_path); relative paths
+are resolved against the manifest's directory.
+
+Usage: python3 batch_reports.py [--jobs N] [--assets-dir DIR] [--lazy-data [--gzip]] [--no-integrity] [--manifest leagues.json] [LEAGUE_DIR ...]
+  With no leagues given, renders this repository's basketball and football reports.
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import FootballReport
+import StandingsReport
+from report_engine import ReportConfig, load_assets, load_template, render_league, write_assets, write_chartjs
+
+def league_from_dir(league_dir, base=StandingsReport.CONFIG):
+    """Build the report config for a league directory laid out like this repository"""
+    league_dir = Path(league_dir)
+    return base._replace(
+        overall_csv=league_dir / 'data' / 'ownersStandingsOverall.csv',
+        detailed_csv=league_dir / 'data' / 'ownersStandings.csv',
+        output_path=league_dir / 'index.html'
+    )
+
+def leagues_from_manifest(manifest_path):
+    """Read report configs from a JSON manifest"""
+    manifest_path = Path(manifest_path)
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    configs = []
+    for entry in entries:
+        configs.append(ReportConfig(
+            league_name=entry['league_name'],
+            emoji=entry.get('emoji', StandingsReport.CONFIG.emoji),
+            overall_csv=manifest_path.parent / entry['overall_csv'],
+            detailed_csv=manifest_path.parent / entry['detailed_csv'],
+            output_path=manifest_path.parent / entry['output_path']
+        ))
+    return configs
+
+def load_report_files():
+    """Compile the report template and assets so every league can reuse them"""
+    load_template()
+    load_assets()
+
+def render_task(config, assets_dir=None, lazy_data=False, precompress=False, integrity=True):
+    """Render one league without raising, returning (config, owners, seconds, error)"""
+    try:
+        owners, seconds = render_league(config, assets_dir, lazy_data, precompress, integrity)
+    except Exception as e:
+        return config, 0, 0.0, f"{type(e).__name__}: {e}"
+    return config, owners, seconds, ''
+
+def render_leagues(configs, jobs=1, assets_dir=None, lazy_data=False, precompress=False, integrity=True):
+    """Render every league, in this process or over a process pool, yielding results as they finish"""
+    load_report_files()
+    if assets_dir is not None:
+        # Write the shared assets once up front rather than racing to create them in every worker
+        Path(assets_dir).mkdir(parents=True, exist_ok=True)
+        write_assets(assets_dir)
+        write_chartjs(assets_dir)
+
+    if jobs <= 1:
+        for config in configs:
+            yield render_task(config, assets_dir, lazy_data, precompress, integrity)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=load_report_files) as pool:
+        futures = [pool.submit(render_task, config, assets_dir, lazy_data, precompress, integrity)
+                   for config in configs]
+        for future in as_completed(futures):
+            yield future.result()
+
+def parse_args(args):
+    """Return (configs, jobs, options) from the command line"""
+    jobs = 1
+    options = {'assets_dir': None, 'lazy_data': False, 'precompress': False, 'integrity': True}
+    configs = []
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        if arg == '--jobs':
+            jobs = int(args.pop(0))
+        elif arg == '--assets-dir':
+            options['assets_dir'] = args.pop(0)
+        elif arg == '--lazy-data':
+            options['lazy_data'] = True
+        elif arg == '--gzip':
+            options['precompress'] = True
+        elif arg == '--no-integrity':
+            options['integrity'] = False
+        elif arg == '--manifest':
+            configs.extend(leagues_from_manifest(args.pop(0)))
+        else:
+            configs.append(league_from_dir(arg))
+    if not configs:
+        configs = [StandingsReport.CONFIG, FootballReport.CONFIG]
+    return configs, jobs, options
+
+def main():
+    configs, jobs, options = parse_args(sys.argv[1:])
+    print(f"Rendering {len(configs)} league reports ({jobs} {'process' if jobs == 1 else 'processes'})")
+
+    start = time.perf_counter()
+    failures = 0
+    for config, owners, seconds, error in render_leagues(configs, jobs, **options):
+        if error:
+            failures += 1
+            print(f"❌ {config.output_path}: {error}")
+        else:
+            print(f"✅ {config.output_path} ({owners} owners, {seconds * 1000:.1f} ms)")
+    wall_seconds = time.perf_counter() - start
+
+    rendered = len(configs) - failures
+    print(f"\n📊 Rendered {rendered}/{len(configs)} leagues in {wall_seconds:.2f} s "
+          f"({rendered / wall_seconds:.1f} leagues/sec)")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark the team-name normalizer on large name corpora
+
+Times normalizer.clean_team_name against the original implementation (two
+re.sub calls with pattern strings per name) on three corpora: league-like
+names that repeat every season, names that are all distinct (every lookup
+misses the cache), and accented/emoji names. It checks that both produce the
+same names for the ASCII corpora, where the output must not change.
+
+Usage: python3 benchmark_normalizer.py [names] [distinct]
+"""
+
+import random
+import re
+import sys
+import time
+
+import normalizer
+from benchmark_parsers import TEAM_NAMES
+
+UNICODE_NAMES = ['Nikola Jokić Fan Club', 'Équipe Ñandú', 'Los Niños 🏀', '🔥🔥', 'Ｆｕｌｌ Ｗｉｄｔｈ', '東京 Bulls']
+
+def original_clean_team_name(name):
+    """The clean_team_name of the standings parser before the normalizer"""
+    cleaned = re.sub(r'[^a-zA-Z0-9\s]', '', name)
+    return re.sub(r'\s+', ' ', cleaned).strip()
+
+def make_corpus(size, distinct, base_names, seed=0):
+    """Return size names drawn from distinct variants of base_names"""
+    rng = random.Random(seed)
+    variants = [base_names[i % len(base_names)] + ('' if i < len(base_names) else f' #{i}') for i in range(distinct)]
+    return [rng.choice(variants) for _ in range(size)]
+
+def time_function(function, corpus, repeat=3):
+    """Return (best seconds for one pass over the corpus, the cleaned names)"""
+    best = None
+    for _ in range(repeat):
+        normalizer.clean_team_name.cache_clear()
+        start = time.perf_counter()
+        cleaned = [function(name) for name in corpus]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, cleaned
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+
+    corpora = {
+        'league names': make_corpus(size, distinct, TEAM_NAMES),
+        'all distinct': make_corpus(size, size, TEAM_NAMES),
+        'unicode names': make_corpus(size, distinct, UNICODE_NAMES + TEAM_NAMES)
+    }
+
+    print(f"{size:,} names per corpus (cache size {normalizer.NAME_CACHE_SIZE:,})")
+    print(f"\n{'Corpus':<16}{'Original':>12}{'Normalizer':>12}{'Speedup':>10}{'Cache hits':>12}")
+    mismatched = []
+    for label, corpus in corpora.items():
+        original, original_names = time_function(original_clean_team_name, corpus)
+        cached, cached_names = time_function(normalizer.clean_team_name, corpus)
+        info = normalizer.clean_team_name.cache_info()
+        hit_rate = info.hits / (info.hits + info.misses)
+        print(f"{label:<16}{original / size * 1e9:>10.0f}ns{cached / size * 1e9:>10.0f}ns"
+              f"{original / cached:>9.1f}x{hit_rate:>12.1%}")
+        if label != 'unicode names' and cached_names != original_names:
+            mismatched.append(label)
+
+    if mismatched:
+        print(f"\n❌ Normalized names differ from the original for: {', '.join(mismatched)}")
+        sys.exit(1)
+    print("\n✓ ASCII names are cleaned exactly as before")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark the standings parser engines on a synthetic ESPN league history page
+
+Builds a page with many season-container blocks (100 by default), then times
+each standings_parser engine and checks they all return the same rows. It also
+times the season cache: cold, warm, and warm after one new season is added.
+
+Usage: python3 benchmark_parsers.py [seasons] [teams]
+"""
+
+import io
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import standings_parser
+
+TEAM_NAMES = [
+    'Utah Bootleggers', 'The Penthouse Panda Bear', 'Austin Football Team',
+    'Toso Viti Toso', "I’m Trying Jennifer", 'Fly Nye Guy', 'Miami Mambas',
+    "Nowitzki's Fadeaway", 'Bull City Bums', 'Baton Rouge Beasts',
+    'Ari 47/1', 'Team Carter', 'UTEP 2 Steps', 'Teh Mehs'
+]
+
+def make_season_block(year, teams, rng):
+    """Build one season-container block in the same shape as the ESPN page"""
+    games = 19
+    rows = []
+    for rank, team in enumerate(rng.sample(teams, len(teams)), 1):
+        wins = rng.randint(0, games)
+        ties = rng.randint(0, games - wins) if rng.random() < 0.1 else 0
+        losses = games - wins - ties
+        rows.append(
+            f'<tr class="Table__TR Table__TR--md Table__odd" data-idx="{rank - 1}">'
+            f'<td class="Table__TD"><div class="jsx-2810852873 table--cell">{rank}</div></td>'
+            f'<td class="Table__TD"><div title="{team}" class="jsx-2810852873 table--cell team__column">'
+            f'<div class="jsx-740313253 flex team__column__content w-100">'
+            f'<a class="AnchorLink flex items-center team--link inline-flex v-mid" tabindex="0" rel="">'
+            f'<div data-testid="croppable-image" class="jsx-1141285347 croppable-image team-logo w-100">'
+            f'<img alt="" class="Image team-logo w-100" src="https://g.espncdn.com/logo-{rank}.svg"></div>'
+            f'<span title="{team}" class="teamName truncate">{team}</span></a></div></div></td>'
+            f'<td class="Table__TD"><span class="">{wins}-{losses}-{ties}</span></td></tr>'
+        )
+
+    return (
+        f'<div class="season-container">'
+        f'<div class="jsx-1093571074 year-header-container"><span class="jsx-1093571074 year-text">{year}</span>'
+        f'<span class="jsx-1093571074"><a class="AnchorLink historyLink" href="/basketball/league/standings?seasonId={year}">'
+        f'Show Full Standings</a></span></div>'
+        f'<div class="jsx-3523935329 top-finishers flex justify-around items-end">'
+        f'<div class="jsx-3523935329 trophy flex flex-column items-center relative">{teams[0]}</div></div>'
+        f'<div class="standings-table"><table class="Table" style="border-collapse: collapse;">'
+        f'<thead class="Table__THEAD"></thead><tbody class="Table__TBODY">{"".join(rows)}</tbody></table></div>'
+        f'</div>'
+    )
+
+def synthetic_team_names(teams):
+    """Return the team names used on a synthetic page with the given number of teams"""
+    return [TEAM_NAMES[i % len(TEAM_NAMES)] + ('' if i < len(TEAM_NAMES) else f' {i}') for i in range(teams)]
+
+def make_synthetic_page(seasons=100, teams=12, seed=0):
+    """Build a league history page with the given number of seasons"""
+    rng = random.Random(seed)
+    names = synthetic_team_names(teams)
+    blocks = [make_season_block(2025 - i, names, rng) for i in range(seasons)]
+    return (
+        '<div class="jsx-303379347 league-history-container"><div class="jsx-303379347 content">'
+        + ''.join(blocks)
+        + '</div></div>'
+    )
+
+def time_engine(engine, html_path, repeat):
+    """Return (best wall time, peak traced memory, rows) for one parser engine"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = list(standings_parser.parse_standings(html_path, engine=engine))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    for _ in standings_parser.parse_standings(html_path, engine=engine):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak, rows
+
+def available_engines():
+    """Return the parser engines whose dependencies are installed"""
+    engines = []
+    for engine, module in (('soup', 'bs4'), ('htmlparser', None), ('lxml', 'lxml.etree')):
+        if module:
+            try:
+                __import__(module)
+            except ImportError:
+                print(f"Skipping {engine}: {module} is not installed")
+                continue
+        engines.append(engine)
+    return engines
+
+def time_season_cache(page, newer_page, tmp_dir, repeat):
+    """Return best wall times for cold, warm and one-new-season runs of the season cache"""
+    html_path = Path(tmp_dir) / 'cache_standings.html'
+    cache_path = Path(tmp_dir) / 'seasons.json'
+
+    def timed_run(content, warm_from=None):
+        best = None
+        for _ in range(repeat):
+            if warm_from:
+                # Start every repetition from a cache of the older page
+                cache_path.write_text(warm_from, encoding='utf-8')
+            elif cache_path.exists():
+                cache_path.unlink()
+            html_path.write_text(content, encoding='utf-8')
+            start = time.perf_counter()
+            cache = standings_parser.SeasonCache(cache_path)
+            rows = list(standings_parser.parse_standings(html_path, cache=cache))
+            cache.save()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, rows, cache
+
+    cold, _, _ = timed_run(page)
+    warm_cache = cache_path.read_text(encoding='utf-8')
+    warm, _, _ = timed_run(page, warm_cache)
+    incremental, rows, cache = timed_run(newer_page, warm_cache)
+    return cold, warm, incremental, cache, rows
+
+def main():
+    seasons = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    teams = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    repeat = 3
+
+    page = make_synthetic_page(seasons, teams)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        html_path = Path(tmp_dir) / 'synthetic_standings.html'
+        html_path.write_text(page, encoding='utf-8')
+        print(f"Synthetic page: {seasons} seasons x {teams} teams ({len(page) / 1024:.0f} KB)")
+
+        results = {}
+        for engine in available_engines():
+            results[engine] = time_engine(engine, html_path, repeat)
+
+        newer_page = make_synthetic_page(seasons + 1, teams)
+        cold, warm, incremental, cache, cached_rows = time_season_cache(page, newer_page, tmp_dir, repeat)
+
+    baseline = results.get('soup')
+    print(f"\n{'Mode':<12}{'Best time':>12}{'Peak memory':>14}{'Rows':>8}{'Speedup':>10}")
+    for engine, (elapsed, peak, rows) in results.items():
+        speedup = f"{baseline[0] / elapsed:.1f}x" if baseline else '-'
+        print(f"{engine:<12}{elapsed * 1000:>10.1f}ms{peak / 1024 / 1024:>12.1f}MB{len(rows):>8}{speedup:>10}")
+
+    print(f"\nSeason cache (stream engine):")
+    print(f"  cold cache             {cold * 1000:>8.1f}ms")
+    print(f"  warm cache             {warm * 1000:>8.1f}ms")
+    print(f"  one new season added   {incremental * 1000:>8.1f}ms  ({cache.misses} parsed, {cache.hits} reused)")
+
+    if cached_rows != list(standings_parser.parse_standings(io.StringIO(newer_page))):
+        print("\n❌ Cached parse differs from a full parse")
+        sys.exit(1)
+
+    reference = next(iter(results.values()))[2]
+    mismatched = [engine for engine, (_, _, rows) in results.items() if rows != reference]
+    if mismatched:
+        print(f"\n❌ Parser output differs for: {', '.join(mismatched)}")
+        sys.exit(1)
+    print("\n✓ All parser engines produced identical rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark every pipeline stage on synthetic leagues
+
+Generates ESPN-style league history pages (see benchmark_parsers.py) and
+matching owner maps at a configurable scale, then times each stage for every
+league: parsing the page, merging owners and aggregating career totals, each
+report compute function, and rendering the HTML. The best time over the
+repetitions, throughput and peak memory of every stage (how far the RSS
+rose above its start while the stage ran, see profiling.StageProfiler) are
+appended to a JSON results file together with the run's settings and the
+process's peak RSS, and compared with the last run at the same scale so
+regressions stand out.
+
+Usage: python3 benchmark_pipeline.py [--seasons N] [--teams N] [--leagues N] [--repeat N] [--output PATH]
+"""
+
+import datetime
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import ownersStandings
+import report_engine
+from benchmark_parsers import make_synthetic_page, synthetic_team_names
+from profiling import MEMORY_MARKS, ProfileOptions, StageProfiler, peak_rss_mb
+from report_engine import ReportConfig
+from standings_parser import clean_team_name, parse_standings, sort_standings
+
+RESULTS_PATH = '../benchmark_results.json'
+DEFAULTS = {'seasons': 20, 'teams': 12, 'leagues': 4, 'repeat': 3}
+
+# Report compute functions, timed one by one on the merged and aggregated data
+REPORT_STEPS = [
+    ('report.prepare_chart_data', lambda d: report_engine.downsample_chart_data(
+        report_engine.prepare_chart_data(d['detailed'])), 'detailed'),
+    ('report.prepare_boxplot_data', lambda d: report_engine.prepare_boxplot_data(d['detailed']), 'detailed'),
+    ('report.calculate_cumulative_playoff_percentages',
+     lambda d: report_engine.calculate_cumulative_playoff_percentages(d['detailed']), 'detailed'),
+    ('report.calculate_playoff_slider_table',
+     lambda d: report_engine.calculate_playoff_slider_table(d['detailed']), 'detailed'),
+    ('report.prepare_career_table', lambda d: report_engine.prepare_career_table(d['standings']), 'standings'),
+    ('report.prepare_season_table', lambda d: report_engine.prepare_season_table(d['detailed']), 'detailed'),
+    ('report.calculate_additional_stats',
+     lambda d: report_engine.calculate_additional_stats(d['standings']), 'standings')
+]
+
+def make_owner_map(teams, seed=0):
+    """Map every synthetic team (as the parser cleans its name) to an owner
+
+    About a quarter of the owners run two teams, like long-running real leagues.
+    """
+    rng = random.Random(seed)
+    owner_count = max(1, teams - teams // 4)
+    return {
+        clean_team_name(name): f"Owner {i if i < owner_count else rng.randrange(owner_count)}"
+        for i, name in enumerate(synthetic_team_names(teams))
+    }
+
+def timed(function, repeat):
+    """Return (result, best wall time, (peak memory MB, memory source)) of calling function repeat times"""
+    best = None
+    with StageProfiler('benchmark', ProfileOptions()) as profiler:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    return result, best, (profiler.peak_memory_mb, profiler.memory_source)
+
+def benchmark_league(html_path, owners_map, output_path, repeat, record):
+    """Run every stage for one league, passing each measurement to record(stage, seconds, rows, memory)"""
+    rows, seconds, memory = timed(lambda: sort_standings(parse_standings(html_path)), repeat)
+    record('parse', seconds, len(rows), memory)
+    standings = [row._asdict() for row in rows]
+
+    def merge():
+        accumulator = ownersStandings.OwnerStandingsAccumulator(owners_map, ownersStandings.choose_backend(len(standings)))
+        merged = [accumulator.add(row) for row in standings]
+        return merged, accumulator.aggregate()
+
+    (merged, overall), seconds, memory = timed(merge, repeat)
+    record('merge', seconds, len(merged), memory)
+
+    data = {
+        'standings': report_engine.prepare_overall_standings(overall),
+        'detailed': report_engine.prepare_detailed_standings(merged)
+    }
+    for name, step, source in REPORT_STEPS:
+        _, seconds, memory = timed(lambda: step(data), repeat)
+        record(name, seconds, len(data[source]), memory)
+
+    config = ReportConfig('Benchmark', '🏆', None, None, output_path)
+
+    def render():
+        html_chunks, _ = report_engine.build_report(config, data['standings'], data['detailed'])
+        report_engine.write_report(html_chunks, output_path)
+
+    _, seconds, memory = timed(render, repeat)
+    record('render', seconds, len(merged), memory)
+
+def git_commit():
+    """Return the short hash of the checked-out commit, or None outside a git checkout"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+def load_results(path):
+    """Read the list of previous benchmark runs"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return []
+
+def run_benchmark(seasons, teams, leagues, repeat):
+    """Benchmark all stages over the synthetic leagues and return the run record"""
+    stages = {}
+
+    def record(stage, seconds, rows, memory):
+        peak_memory_mb, memory_source = memory
+        totals = stages.setdefault(stage, {'seconds': 0.0, 'rows': 0, 'peak_memory_mb': None})
+        totals['seconds'] += seconds
+        totals['rows'] += rows
+        if peak_memory_mb is not None:
+            totals['peak_memory_mb'] = max(totals['peak_memory_mb'] or 0.0, peak_memory_mb)
+        totals['memory_source'] = memory_source
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for league in range(leagues):
+            html_path = Path(tmp_dir) / f'league{league}.html'
+            html_path.write_text(make_synthetic_page(seasons, teams, seed=league), encoding='utf-8')
+            benchmark_league(html_path, make_owner_map(teams, seed=league), Path(tmp_dir) / f'league{league}_index.html',
+                             repeat, record)
+    wall_seconds = time.perf_counter() - start
+
+    for totals in stages.values():
+        totals['rows_per_second'] = totals['rows'] / totals['seconds'] if totals['seconds'] > 0 else None
+
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {'seasons': seasons, 'teams': teams, 'leagues': leagues, 'repeat': repeat},
+        'wall_seconds': wall_seconds,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': stages
+    }
+
+def print_run(run, previous=None):
+    """Print the stage timings, with the change since the previous comparable run"""
+    settings = run['settings']
+    print(f"\n{settings['leagues']} leagues x {settings['seasons']} seasons x {settings['teams']} teams "
+          f"(best of {settings['repeat']})")
+    print(f"{'Stage':<50}{'Time':>11}{'Rows/s':>13}{'Peak mem':>11}{'Change':>9}")
+    for stage, totals in run['stages'].items():
+        change = ''
+        before = previous['stages'].get(stage) if previous else None
+        if before and before['seconds'] > 0:
+            change = f"{(totals['seconds'] / before['seconds'] - 1) * 100:+.0f}%"
+        rate = f"{totals['rows_per_second']:,.0f}" if totals['rows_per_second'] else '-'
+        memory = '-'
+        if totals['peak_memory_mb'] is not None:
+            memory = f"{totals['peak_memory_mb']:.1f}MB{MEMORY_MARKS.get(totals['memory_source'], '')}"
+        print(f"{stage:<50}{totals['seconds'] * 1000:>9.1f}ms{rate:>13}{memory:>11}{change:>9}")
+    sources = {totals['memory_source'] for totals in run['stages'].values()}
+    if 'rss' in sources:
+        print("+ rise of the peak RSS above the RSS at the start of the stage")
+    if 'process-rss' in sources:
+        print("* peak RSS of the process so far (the stage peak cannot be measured on this platform)")
+    peak = f"{run['peak_rss_mb']:.0f} MB" if run['peak_rss_mb'] is not None else 'unknown'
+    print(f"\nTotal wall time: {run['wall_seconds']:.2f} s, process peak RSS: {peak}")
+
+def parse_args(args):
+    """Parse the command line into (settings, output path)"""
+    settings = dict(DEFAULTS)
+    output = RESULTS_PATH
+    i = 0
+    while i < len(args):
+        name = args[i].lstrip('-')
+        if name in settings:
+            settings[name] = int(args[i + 1])
+        elif name == 'output':
+            output = args[i + 1]
+        else:
+            raise SystemExit(f"Unknown argument: {args[i]}\n{__doc__.strip().splitlines()[-1]}")
+        i += 2
+    return settings, output
+
+def main():
+    settings, output = parse_args(sys.argv[1:])
+    print("⏱️  Pipeline benchmark")
+    run = run_benchmark(**settings)
+
+    results = load_results(output)
+    previous = next((r for r in reversed(results) if r['settings'] == run['settings']), None)
+    print_run(run, previous)
+
+    results.append(run)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"📁 Results appended to {output}" + (f" (compared with the run of {previous['timestamp']})" if previous else ''))
+
+if __name__ == "__main__":
+    main()
@@ -7,80 +7,113 @@ This script runs the complete data processing pipeline in the correct order:
 2. owners.py - Generate owners mapping CSV
 3. ownersStandings.py - Merge data and create both detailed and aggregated standings
 
-Usage: python3 data_pipeline.py
+The steps run as functions in this process (see pipeline.py), so parsed
+standings and the owner mapping are handed over in memory and each step
+reports its wall time. Steps whose input files are unchanged since their
+last successful run are skipped (see manifest.py).
+
+Usage: python3 data_pipeline.py [--force] [--verbose | --quiet] [--log-json]
+                                [--profile [--cprofile] [--tracemalloc] [--trace PATH]]
+  --force        rerun every step even if its inputs are unchanged, re-parsing every season
+  --verbose      also log debug detail
+  --quiet        only log warnings and errors
+  --log-json     log one JSON object per line, with a summary record per step
+  --profile      record wall time, CPU time, peak memory and rows for every step
+                 and write them as Chrome trace-event JSON (../data/profile/trace.json)
+  --cprofile     with --profile, also run each step under cProfile (.prof files
+                 are written next to the trace)
+  --tracemalloc  with --profile, measure each step's peak Python allocations (slower)
+  --trace PATH   with --profile, write the trace to PATH instead
+
+Interpreter start-up itself is not part of the trace; python3 -X importtime
+breaks that down.
 """
 
-import subprocess
-import sys
+import time
+
+# Time the module imports, so the trace shows them next to the steps
+IMPORT_START = time.time()
+_import_clock = time.perf_counter()
+
+import logging
 import os
+import sys
+from pathlib import Path
 
-def run_script(script_name, description):
-    """Run a Python script and handle errors"""
-    print(f"\n{'='*60}")
-    print(f"Running: {script_name}")
-    print(f"Description: {description}")
-    print(f"{'='*60}")
-    
-    try:
-        result = subprocess.run([sys.executable, script_name], 
-                              capture_output=True, 
-                              text=True, 
-                              check=True)
-        
-        # Print the output
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-            
-        print(f"✓ {script_name} completed successfully")
-        return True
-        
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Error running {script_name}")
-        print(f"Exit code: {e.returncode}")
-        if e.stdout:
-            print("STDOUT:", e.stdout)
-        if e.stderr:
-            print("STDERR:", e.stderr)
-        return False
+from logs import setup_logging, summary_lines
+from manifest import Manifest
+from pipeline import (BASKETBALL, log_stage_result, log_timing_report, owners_stage, refresh_seasons, report_stages,
+                      run_pipeline)
+from profiling import PROFILE_DIR, ProfileOptions, log_profile_report, write_chrome_trace
+
+IMPORT_SECONDS = time.perf_counter() - _import_clock
+
+logger = logging.getLogger(__name__)
+
+def log_step_header(stage):
+    """Log the banner shown before each pipeline step"""
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Running: {stage.name}")
+    logger.info(f"Description: {stage.description}")
+    logger.info(f"{'='*60}")
+
+def log_step_result(result):
+    """Log the outcome of a pipeline step and its summary record"""
+    if result.skipped:
+        logger.info(f"\n- {result.name} skipped: inputs unchanged")
+    elif result.success:
+        for line in summary_lines(result.summary):
+            logger.info(line)
+        logger.info(f"✓ {result.name} completed successfully ({result.seconds * 1000:.1f} ms)")
+    else:
+        logger.error(f"✗ Error running {result.name}")
+        logger.error(f"Error: {result.error}")
+    log_stage_result(result)
+
+def profile_options(args):
+    """Return the ProfileOptions requested on the command line, or None without --profile"""
+    if '--profile' not in args:
+        return None
+    return ProfileOptions(cprofile='--cprofile' in args, tracemalloc='--tracemalloc' in args)
 
 def main():
-    print("Fantasy Basketball League Data Pipeline")
-    print("=====================================")
+    args = sys.argv[1:]
+    setup_logging(args)
+    logger.info("Fantasy Basketball League Data Pipeline")
+    logger.info("=====================================")
     
     # Change to the src directory to ensure relative paths work
     script_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(script_dir)
-    print(f"Working directory: {os.getcwd()}")
+    logger.info(f"Working directory: {os.getcwd()}")
     
     # Define the pipeline steps
+    force = '--force' in args
+    league = refresh_seasons(BASKETBALL) if force else BASKETBALL
+    extract_step, merge_step, _ = report_stages(league, ("rawStandings.py", "ownersStandings.py", "StandingsReport.py"))
     pipeline_steps = [
-        ("rawStandings.py", "Parse HTML standings and create rawStandings.csv"),
-        ("owners.py", "Generate team-to-owner mapping CSV"),
-        ("ownersStandings.py", "Merge standings with owners and create aggregated data")
+        extract_step._replace(description="Parse HTML standings and create rawStandings.csv"),
+        owners_stage(league),
+        merge_step._replace(description="Merge standings with owners and create aggregated data")
     ]
     
-    # Track success of each step
-    results = []
+    # Run each step in the pipeline, stopping at the first failure
+    manifest = None if force else Manifest()
+    profile = profile_options(args)
+    results = run_pipeline(pipeline_steps, manifest=manifest,
+                           on_start=log_step_header, on_result=log_step_result, profile=profile)
     
-    # Run each step in the pipeline
-    for script_name, description in pipeline_steps:
-        success = run_script(script_name, description)
-        results.append((script_name, success))
-        
-        if not success:
-            print(f"\n❌ Pipeline failed at step: {script_name}")
-            print("Stopping pipeline execution.")
-            break
+    if not results[-1].success:
+        logger.error(f"\n❌ Pipeline failed at step: {results[-1].name}")
+        logger.error("Stopping pipeline execution.")
     else:
         # If we completed all steps without breaking
-        print(f"\n{'='*60}")
-        print("🎉 DATA PIPELINE COMPLETED SUCCESSFULLY!")
-        print(f"{'='*60}")
+        logger.info(f"\n{'='*60}")
+        logger.info("🎉 DATA PIPELINE COMPLETED SUCCESSFULLY!")
+        logger.info(f"{'='*60}")
         
         # Show final summary
-        print("\nGenerated files:")
+        logger.info("\nGenerated files:")
         data_files = [
             "../data/rawStandings.csv",
             "../data/owners.csv", 
@@ -90,17 +123,25 @@ def main():
         
         for file_path in data_files:
             if os.path.exists(file_path):
-                print(f"  ✓ {file_path}")
+                logger.info(f"  ✓ {file_path}")
             else:
-                print(f"  ✗ {file_path} (missing)")
+                logger.warning(f"  ✗ {file_path} (missing)")
     
     # Print final summary
-    print(f"\n{'='*60}")
-    print("PIPELINE SUMMARY")
-    print(f"{'='*60}")
-    for script_name, success in results:
-        status = "✓ SUCCESS" if success else "✗ FAILED"
-        print(f"  {script_name}: {status}")
+    logger.info(f"\n{'='*60}")
+    logger.info("PIPELINE SUMMARY")
+    logger.info(f"{'='*60}")
+    for result in results:
+        status = "- SKIPPED" if result.skipped else "✓ SUCCESS" if result.success else "✗ FAILED"
+        logger.info(f"  {result.name}: {status}")
+    log_timing_report(results)
+
+    if profile is not None:
+        profiles = [result.profile for result in results if result.profile is not None]
+        log_profile_report(profiles)
+        trace_path = args[args.index('--trace') + 1] if '--trace' in args else str(Path(PROFILE_DIR) / 'trace.json')
+        write_chrome_trace(profiles, trace_path, [('imports', IMPORT_START, IMPORT_SECONDS)])
+        logger.info(f"\n📁 Trace written to {trace_path} (open it in chrome://tracing or ui.perfetto.dev)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,67 +1,116 @@
 #!/usr/bin/env python3
 """
 Unified script to generate both Fantasy Basketball and Fantasy Football reports
+
+The basketball and football chains are independent, so by default they run
+at the same time in a process pool; the stages within a chain hand their data
+to each other in memory (see pipeline.py).
+
+Stages whose input files have not changed since their last successful run
+are skipped (see manifest.py).
+
+Every stage reports a summary dict (see logs.py); the run totals at the end
+are computed from those, and --log-json emits them as machine-readable records.
+
+Usage: python3 generate_all_reports.py [--no-csv] [--jobs N] [--force] [--no-integrity] [--verbose | --quiet] [--log-json]
+  --no-csv        skip writing the intermediate CSV files in ../data (disables skipping)
+  --jobs N        number of worker processes (1 runs every stage in this process)
+  --force         rebuild every stage even if its inputs are unchanged, re-parsing every season
+  --no-integrity  load Chart.js without its integrity hash, for pages opened from disk
+  --verbose       also log debug detail
+  --quiet         only log warnings and errors
+  --log-json      log one JSON object per line, with a summary record per stage and for the run
 """
 
-import subprocess
+import logging
 import sys
 import os
+import time
 from pathlib import Path
 
-def run_script(script_name, description):
-    """Run a Python script and handle errors"""
-    print(f"\n🔄 {description}...")
-    try:
-        result = subprocess.run([sys.executable, script_name], 
-                              capture_output=True, text=True, check=True)
-        print(f"✅ {description} completed successfully")
-        if result.stdout.strip():
-            # Print only the summary lines, not all the detailed output
-            lines = result.stdout.strip().split('\n')
-            summary_lines = [line for line in lines if any(keyword in line for keyword in 
-                           ['Total records:', 'Years covered:', 'Sample data:', 'Report generated successfully:', 'Best performer:'])]
-            for line in summary_lines:
-                print(f"   {line}")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error in {description}:")
-        print(f"   {e.stderr}")
-        return False
-    return True
+from logs import log_summary, setup_logging, summary_lines
+from manifest import Manifest
+from pipeline import (BASKETBALL, FOOTBALL, log_stage_result, log_timing_report, refresh_seasons, report_stages,
+                      run_pipeline, without_integrity)
+
+logger = logging.getLogger(__name__)
+
+def log_result(result):
+    """Log the outcome of one pipeline stage and its summary record"""
+    if result.skipped:
+        logger.info(f"⏭️  {result.description} skipped (inputs unchanged)")
+    elif result.success:
+        logger.info(f"✅ {result.description} completed successfully")
+        for line in summary_lines(result.summary):
+            logger.info(f"   {line}")
+    else:
+        logger.error(f"❌ Error in {result.description}:")
+        logger.error(f"   {result.error}")
+    log_stage_result(result)
+
+def run_summary(results, wall_seconds):
+    """Combine the stage summaries into totals for the whole run"""
+    summaries = [result.summary for result in results]
+    merges = [summary for summary in summaries if 'records' in summary and 'owners' in summary]
+    reports = [summary for summary in summaries if 'best_performer' in summary and 'output' in summary]
+    return {
+        'stages': len(results),
+        'succeeded': sum(1 for result in results if result.success),
+        'skipped': sum(1 for result in results if result.skipped),
+        'records': sum(summary['records'] for summary in merges),
+        'owners': sum(summary['owners'] for summary in merges),
+        'reports': {summary['output']: summary['best_performer'] for summary in reports},
+        'wall_seconds': wall_seconds
+    }
 
 def main():
-    """Main function to run all report generation scripts"""
-    print("🏈🏀 Fantasy League Analytics Pipeline")
-    print("=" * 50)
-    
+    """Main function to run all report generation stages"""
+    args = sys.argv[1:]
+    setup_logging(args)
+    logger.info("🏈🏀 Fantasy League Analytics Pipeline")
+    logger.info("=" * 50)
+
     # Change to src directory
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
-    
-    scripts = [
-        ("rawStandings.py", "Extracting Basketball League standings"),
-        ("ownersStandings.py", "Merging Basketball owners and calculating stats"),
-        ("StandingsReport.py", "Generating Basketball League report (index.html)"),
-        ("fbStandings.py", "Extracting Football League standings"), 
-        ("fbOwnersStandings.py", "Merging Football owners and calculating stats"),
-        ("FootballReport.py", "Generating Football League report (fb_index.html)")
-    ]
-    
-    success_count = 0
-    for script, description in scripts:
-        if run_script(script, description):
-            success_count += 1
-        else:
-            print(f"\n❌ Pipeline failed at: {description}")
-            sys.exit(1)
-    
-    print(f"\n🎉 Pipeline completed successfully!")
-    print(f"✅ Generated {success_count}/{len(scripts)} reports")
-    print(f"\n📁 Output files:")
-    print(f"   🏀 Basketball League: ../index.html")
-    print(f"   🏈 Football League: ../fb_index.html")
-    print(f"\n🌐 View reports:")
-    print(f"   Basketball: file://{Path('../index.html').resolve()}")
-    print(f"   Football: file://{Path('../fb_index.html').resolve()}")
+
+    write_csv = '--no-csv' not in args
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else 2
+    force = '--force' in args
+    manifest = None if force else Manifest()
+    basketball, football = (refresh_seasons(BASKETBALL), refresh_seasons(FOOTBALL)) if force else (BASKETBALL, FOOTBALL)
+    if '--no-integrity' in args:
+        basketball, football = without_integrity(basketball), without_integrity(football)
+    stages = (
+        report_stages(basketball, ("rawStandings.py", "ownersStandings.py", "StandingsReport.py")) +
+        report_stages(football, ("fbStandings.py", "fbOwnersStandings.py", "FootballReport.py"))
+    )
+
+    start = time.perf_counter()
+    results = run_pipeline(stages, write_csv=write_csv, jobs=jobs, manifest=manifest, on_result=log_result)
+    wall_seconds = time.perf_counter() - start
+
+    summary = run_summary(results, wall_seconds)
+    if summary['succeeded'] < len(stages):
+        failed = next((result for result in results if not result.success), None)
+        if failed:
+            logger.error(f"\n❌ Pipeline failed at: {failed.description}")
+        log_timing_report(results, wall_seconds)
+        log_summary(logger, 'pipeline', summary)
+        sys.exit(1)
+
+    logger.info(f"\n🎉 Pipeline completed successfully!")
+    logger.info(f"✅ Generated {summary['succeeded']}/{len(stages)} reports ({summary['skipped']} stages up to date)")
+    if summary['records']:
+        logger.info(f"📊 Merged {summary['records']} records for {summary['owners']} owners")
+    log_timing_report(results, wall_seconds)
+    log_summary(logger, 'pipeline', summary)
+    logger.info(f"\n📁 Output files:")
+    logger.info(f"   🏀 Basketball League: ../index.html")
+    logger.info(f"   🏈 Football League: ../fb_index.html")
+    logger.info(f"\n🌐 View reports:")
+    logger.info(f"   Basketball: file://{Path('../index.html').resolve()}")
+    logger.info(f"   Football: file://{Path('../fb_index.html').resolve()}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,70 @@
+"""
+Build manifest used to skip pipeline stages whose inputs have not changed
+
+The manifest is a small JSON file that remembers, for every stage, the content
+hash of each input file it last ran with, and the options it ran with. Hashes are cached per file together
+with its size and modification time, so an untouched file is never re-read.
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST_PATH = '../data/.pipeline_manifest.json'
+
+class Manifest:
+    """Content-hash record of the inputs each stage last ran with"""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        self.files = data.get('files', {})
+        self.stages = data.get('stages', {})
+
+    def file_hash(self, path):
+        """Return the sha256 of a file, reusing the cached hash if size and mtime match"""
+        stat = os.stat(path)
+        cached = self.files.get(path)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+
+        self.files[path] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest.hexdigest()
+        }
+        return digest.hexdigest()
+
+    def fingerprint(self, paths):
+        """Return {path: sha256} for every input path, or None if one is missing"""
+        try:
+            return {path: self.file_hash(path) for path in paths}
+        except FileNotFoundError:
+            return None
+
+    def is_fresh(self, key, inputs, outputs, options=None):
+        """True if the stage last ran with identical inputs and options and its outputs still exist"""
+        entry = self.stages.get(key)
+        if not entry or not inputs or entry.get('options') != options:
+            return False
+        if not all(os.path.exists(path) for path in outputs):
+            return False
+        return entry['inputs'] == self.fingerprint(inputs)
+
+    def record(self, key, fingerprint, options=None):
+        """Remember the input fingerprint and options a stage successfully ran with"""
+        self.stages[key] = {'inputs': fingerprint, 'options': options}
+
+    def save(self):
+        """Write the manifest back to disk"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.files, 'stages': self.stages}, f, indent=2, sort_keys=True)
@@ -0,0 +1,88 @@
+"""
+Team-name normalization shared by the standings parser and owner resolution
+
+clean_team_name() turns the title of a team cell into the name stored in the
+CSVs, and team_key() turns any team name into the key owners are looked up by.
+Team names repeat every season, so both are memoized with an LRU cache and all
+patterns are compiled once.
+
+Unicode names are handled the same way in both:
+  - compatibility forms fold to their plain form (full-width "Ａ" -> "A",
+    "ﬁ" -> "fi"), and accented Latin letters to their base letter
+    ("Jokić" -> "Jokic")
+  - letters and digits of any other script are kept together with their
+    combining marks ("हिंदी टीम" stays as it is)
+  - symbols such as emoji are spelled out by their Unicode names ("Team 🏀" ->
+    "Team Basketball And Hoop", "🔥🔥" -> "Fire Fire"), so teams told apart
+    only by them stay distinct
+  - punctuation is dropped and spaces are collapsed
+
+Plain ASCII names take a fast path and come out exactly as before: only
+letters, digits and single spaces.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+NAME_CACHE_SIZE = 4096
+# Bump whenever clean_team_name output changes, so cached parsed seasons are redone
+NORMALIZER_VERSION = 4
+
+ASCII_NON_NAME_PATTERN = re.compile(r'[^a-zA-Z0-9\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Emoji presentation selectors are marks too, but belong to the spelled-out symbol
+VARIATION_SELECTORS = {chr(code) for code in range(0xFE00, 0xFE10)}
+
+def is_mark(char):
+    """Tell whether char is a combining mark (accent, vowel sign, virama, ...)"""
+    return unicodedata.category(char) in ('Mn', 'Mc')
+
+def fold_unicode(name):
+    """Fold compatibility forms, and accents on Latin letters, of a non-ASCII name"""
+    chars = []
+    latin_base = False
+    for char in unicodedata.normalize('NFKD', name):
+        if is_mark(char):
+            if latin_base:
+                continue
+        else:
+            latin_base = char.isascii() or unicodedata.name(char, '').startswith('LATIN ')
+        chars.append(char)
+    return unicodedata.normalize('NFC', ''.join(chars))
+
+def strip_symbols(name):
+    """Keep letters, digits, whitespace and the marks combining with a kept letter or digit"""
+    chars = []
+    after_letter = False
+    for char in name:
+        category = unicodedata.category(char)
+        if category[0] in 'LN':
+            after_letter = True
+        elif is_mark(char) and after_letter and char not in VARIATION_SELECTORS:
+            pass
+        elif char.isspace():
+            after_letter = False
+        else:
+            after_letter = False
+            continue
+        chars.append(char)
+    return ''.join(chars)
+
+def spell_symbols(name):
+    """Replace each non-ASCII symbol (emoji) in a name with its Unicode name, between spaces"""
+    return ''.join(f" {unicodedata.name(char, '').title()} "
+                   if not char.isascii() and unicodedata.category(char).startswith('S') else char
+                   for char in name)
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def clean_team_name(name):
+    """Keep only letters, digits (with their combining marks) and single spaces in a team name"""
+    if name.isascii():
+        return WHITESPACE_PATTERN.sub(' ', ASCII_NON_NAME_PATTERN.sub('', name)).strip()
+    return WHITESPACE_PATTERN.sub(' ', strip_symbols(spell_symbols(fold_unicode(name)))).strip()
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def team_key(name):
+    """Normalize a team name for lookups: clean_team_name, case-folded"""
+    return clean_team_name(name).casefold()
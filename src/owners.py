@@ -4,6 +4,12 @@ Add owner column to fantasy basketball CSV files
 """
 
 import csv
+import logging
+import sys
+
+from logs import log_summary, setup_logging
+
+logger = logging.getLogger(__name__)
 
 owner_mapping = {
     'Utah Bootleggers': 'Trafton',
@@ -36,15 +42,25 @@ owner_mapping = {
     "Kawhis Laugh": 'Chris'
 }
 
-# Create simple owners mapping CSV
-print("\nCreating owners mapping CSV...")
-owners_csv_filename = '../data/owners.csv'
-with open(owners_csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-    fieldnames = ['Team', 'Owner']
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-    
-    writer.writeheader()
-    for team, owner in sorted(owner_mapping.items()):
-        writer.writerow({'Team': team, 'Owner': owner})
-
-print(f"Owners mapping saved to: {owners_csv_filename}")
+OWNERS_CSV = '../data/owners.csv'
+
+def write_owners_csv(mapping, owners_csv_filename):
+    """Write the team-to-owner mapping to CSV"""
+    with open(owners_csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+        fieldnames = ['Team', 'Owner']
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+
+        writer.writeheader()
+        for team, owner in sorted(mapping.items()):
+            writer.writerow({'Team': team, 'Owner': owner})
+
+def main():
+    setup_logging(sys.argv[1:])
+    # Create simple owners mapping CSV
+    logger.info("\nCreating owners mapping CSV...")
+    write_owners_csv(owner_mapping, OWNERS_CSV)
+    logger.info(f"Owners mapping saved to: {OWNERS_CSV}")
+    log_summary(logger, 'owners', {'mappings': len(owner_mapping), 'output': OWNERS_CSV})
+
+if __name__ == "__main__":
+    main()
@@ -1,147 +1,449 @@
 #!/usr/bin/env python3
 """
 Merge rawStandings.csv with owners.csv to create ownersStandings.csv
+
+Owners are looked up through an OwnerIndex. Besides the exact team name it
+matches on normalizer.team_key (case, punctuation, spacing and accents are
+ignored, so "Ari 47/1" finds "Ari 471") and then on a looser alias key that
+also ignores the spaces between words ("J Mapps Stepover"). Alias-only matches
+are logged, as they may be a different team. An owners CSV may carry an
+optional Year column for teams that changed hands; those rows win over the
+team's plain mapping for that season. Teams that still have no owner are
+logged together in one warning at the end of the merge.
+
+Owner totals can be aggregated by two backends that produce identical output:
+  python - one loop over the merged records (default for small leagues)
+  numpy  - load the records into typed column arrays and compute every total
+           with one vectorized group-by (used automatically for large
+           histories when NumPy is installed)
+
+Usage: python3 ownersStandings.py [--numpy | --python] [--verbose | --quiet] [--log-json]
+  --verbose    also log per-owner record counts, sample rows and the top 10
+  --quiet      only log warnings and errors
+  --log-json   log one JSON object per line, ending with a summary record
 """
 
 import csv
+import logging
+import sys
+from array import array
 
-# Read owners mapping
-print("Reading owners mapping...")
-owners_map = {}
-with open('../data/owners.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        owners_map[row['Team']] = row['Owner']
-
-print(f"Loaded {len(owners_map)} team-owner mappings")
-
-# Read raw standings and merge with owners
-print("Reading raw standings and merging with owners...")
-merged_data = []
-with open('../data/rawStandings.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        team = row['Team']
-        owner = owners_map.get(team, 'Unknown')
-        
-        # Create merged record
-        merged_record = {
-            'Year': row['Year'],
-            'Team': team,
-            'Owner': owner,
-            'Rank': row['Rank'],
-            'Wins': row['Wins'],
-            'Losses': row['Losses'],
-            'Ties': row['Ties']
-        }
-        merged_data.append(merged_record)
-
-print(f"Merged {len(merged_data)} records")
-
-# Write merged data to CSV
-output_filename = '../data/ownersStandings.csv'
-with open(output_filename, 'w', newline='', encoding='utf-8') as f:
-    fieldnames = ['Year', 'Team', 'Owner', 'Rank', 'Wins', 'Losses', 'Ties']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    
-    writer.writeheader()
-    for record in merged_data:
-        writer.writerow(record)
-
-print(f"Merged standings saved to: {output_filename}")
-
-# Create aggregated data across all seasons
-print("\nCreating overall aggregated standings...")
-owner_totals = {}
-for record in merged_data:
-    owner = record['Owner']
-    if owner not in owner_totals:
-        owner_totals[owner] = {
-            'Owner': owner,
-            'Total_Wins': 0,
-            'Total_Losses': 0,
-            'Total_Ties': 0,
-            'Seasons_Played': 0,
-            'Rank_Total': 0,
-            'Championships': 0,
-            'Finals': 0,
-            'Playoffs': 0
+from logs import log_summary, setup_logging
+from normalizer import team_key
+
+logger = logging.getLogger(__name__)
+
+OWNERS_CSV = '../data/owners.csv'
+STANDINGS_CSV = '../data/rawStandings.csv'
+OUTPUT_CSV = '../data/ownersStandings.csv'
+OVERALL_CSV = '../data/ownersStandingsOverall.csv'
+
+MERGED_FIELDNAMES = ['Year', 'Team', 'Owner', 'Rank', 'Wins', 'Losses', 'Ties']
+NUMPY_MIN_ROWS = 100000  # below this, importing NumPy costs more than it saves
+AGGREGATION_BACKENDS = ('python', 'numpy')
+
+UNKNOWN_OWNER = 'Unknown'
+
+OVERALL_FIELDNAMES = ['Owner', 'Seasons_Played', 'Total_Games', 'Total_Wins', 'Total_Losses', 'Total_Ties', 'Win_Percentage', 'Average_Rank', 'Championships', 'Finals', 'Playoffs']
+
+def read_owners_map(owners_csv):
+    """Read the team-to-owner mapping CSV
+
+    Rows with a Year are keyed by (team, year), all others by team.
+    """
+    owners_map = {}
+    with open(owners_csv, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            year = (row.get('Year') or '').strip()
+            owners_map[(row['Team'], year) if year else row['Team']] = row['Owner']
+    return owners_map
+
+def alias_key(key):
+    """Loosen a team_key further by ignoring the spaces between words"""
+    return key.replace(' ', '')
+
+class OwnerIndex:
+    """Resolve team names (and optionally seasons) to owners in O(1)
+
+    The mapping is keyed by team name or by (team, year) for teams that
+    changed hands. Every team is indexed up front under its exact name, its
+    team_key and its alias_key; a normalized or alias key claimed by two
+    different owners is ambiguous and left out, so it never picks an owner at
+    random. Teams matched only through an alias are collected so they can be
+    logged. The resolved owner is remembered per team, with the season
+    overrides looked up on top, so the memo grows with the number of teams
+    rather than the number of rows. Teams that resolve to no owner are
+    collected with the seasons they appeared in.
+    """
+
+    def __init__(self, owners_map=None):
+        self.exact = {}
+        self.season_owners = {}  # (team_key, year) -> owner
+        self.normalized = {}
+        self.aliases = {}
+        self.alias_teams = {}  # alias_key -> the mapped team it came from
+        self.ambiguous = set()
+        self.resolved = {}  # team -> (team_key, owner or None)
+        self.alias_matches = {}  # team -> mapped team it was matched to by alias
+        self.unresolved = {}  # team -> list of years
+
+        for team, owner in (owners_map or {}).items():
+            if isinstance(team, tuple):
+                team, year = team
+                self.season_owners[(team_key(team), str(year))] = owner
+                continue
+            self.exact[team] = owner
+            key = team_key(team)
+            self._add_key(self.normalized, key, owner)
+            self._add_key(self.aliases, alias_key(key), owner)
+            self.alias_teams.setdefault(alias_key(key), team)
+
+        for table in (self.normalized, self.aliases):
+            for key in [key for key, owner in table.items() if owner is None]:
+                del table[key]
+                self.ambiguous.add(key)
+
+    @staticmethod
+    def _add_key(table, key, owner):
+        """Index owner under key, marking the key None once two owners claim it"""
+        if key in table and table[key] != owner:
+            table[key] = None
+        else:
+            table[key] = owner
+
+    def _resolve(self, team, key):
+        """Return (owner, mapped team if only an alias matched) for a team, ignoring seasons"""
+        owner = self.exact.get(team)
+        if owner is None:
+            owner = self.normalized.get(key)
+        if owner is not None:
+            return owner, None
+        key = alias_key(key)
+        owner = self.aliases.get(key)
+        return owner, owner and self.alias_teams[key]
+
+    def owner(self, team, year=None):
+        """Return the owner of team (in year), recording it as unresolved if there is none"""
+        entry = self.resolved.get(team)
+        if entry is None:
+            key = team_key(team)
+            owner, mapped_team = self._resolve(team, key)
+            if mapped_team is not None:
+                self.alias_matches[team] = mapped_team
+            entry = self.resolved[team] = (key, owner)
+        key, owner = entry
+
+        if year is not None and self.season_owners:
+            season_owner = self.season_owners.get((key, str(year)))
+            if season_owner is not None:
+                return season_owner
+        if owner is None:
+            years = self.unresolved.setdefault(team, [])
+            if year is not None:
+                years.append(str(year))
+            return UNKNOWN_OWNER
+        return owner
+
+    def __len__(self):
+        return len(self.exact) + len(self.season_owners)
+
+def owner_index(owners_map):
+    """Return owners_map as an OwnerIndex, building one from a plain mapping"""
+    return owners_map if isinstance(owners_map, OwnerIndex) else OwnerIndex(owners_map)
+
+def read_standings(standings_csv):
+    """Read the raw standings CSV"""
+    with open(standings_csv, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+def iter_standings(standings_csv):
+    """Yield raw standings rows one at a time"""
+    with open(standings_csv, 'r', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
+
+def merge_record(row, owners):
+    """Attach an owner from an OwnerIndex to one standings row"""
+    team = row['Team']
+    return {
+        'Year': row['Year'],
+        'Team': team,
+        'Owner': owners.owner(team, row['Year']),
+        'Rank': row['Rank'],
+        'Wins': row['Wins'],
+        'Losses': row['Losses'],
+        'Ties': row['Ties']
+    }
+
+class OwnerStandingsAccumulator:
+    """Merge standings rows and accumulate owner totals and summary sets in one pass
+
+    Only the totals, the distinct year/team/owner sets and the first few sample
+    rows are kept, so the merged rows themselves can be streamed straight to disk.
+    With the numpy backend the per-row numbers are kept in compact int arrays and
+    aggregated with one vectorized group-by at the end.
+    """
+
+    def __init__(self, owners_map=None, backend='python', sample_size=5):
+        self.owners = owner_index(owners_map)
+        self.backend = backend
+        self.sample_size = sample_size
+        self.record_count = 0
+        self.years = set()
+        self.teams = set()
+        self.owner_codes = {}  # owner -> group code, in order of first appearance
+        self.owner_counts = {}
+        self.samples = []
+        self.owner_totals = {}
+        if backend == 'numpy':
+            self.columns = {key: array('q') for key in ('Code', 'Wins', 'Losses', 'Ties', 'Rank')}
+
+    def add(self, row):
+        """Merge one standings row with its owner, accumulate it and return the merged record"""
+        record = merge_record(row, self.owners)
+        self.add_merged(record)
+        return record
+
+    def add_merged(self, record):
+        """Accumulate one already merged record"""
+        owner = record['Owner']
+        self.record_count += 1
+        self.years.add(record['Year'])
+        self.teams.add(record['Team'])
+        code = self.owner_codes.setdefault(owner, len(self.owner_codes))
+        self.owner_counts[owner] = self.owner_counts.get(owner, 0) + 1
+        if len(self.samples) < self.sample_size:
+            self.samples.append(record)
+
+        wins, losses, ties, rank = int(record['Wins']), int(record['Losses']), int(record['Ties']), int(record['Rank'])
+        if self.backend == 'numpy':
+            columns = self.columns
+            columns['Code'].append(code)
+            columns['Wins'].append(wins)
+            columns['Losses'].append(losses)
+            columns['Ties'].append(ties)
+            columns['Rank'].append(rank)
+            return
+
+        totals = self.owner_totals.get(owner)
+        if totals is None:
+            totals = self.owner_totals[owner] = {
+                'Owner': owner,
+                'Total_Wins': 0,
+                'Total_Losses': 0,
+                'Total_Ties': 0,
+                'Seasons_Played': 0,
+                'Rank_Total': 0,
+                'Championships': 0,
+                'Finals': 0,
+                'Playoffs': 0
+            }
+
+        totals['Total_Wins'] += wins
+        totals['Total_Losses'] += losses
+        totals['Total_Ties'] += ties
+        totals['Seasons_Played'] += 1
+
+        # Track rank statistics
+        totals['Rank_Total'] += rank
+
+        # Count achievements based on final rank
+        if rank == 1:
+            totals['Championships'] += 1
+        if rank <= 2:
+            totals['Finals'] += 1
+        if rank <= 4:
+            totals['Playoffs'] += 1
+
+    def summary(self):
+        """Return the summary counts of everything accumulated so far"""
+        return {
+            'records': self.record_count,
+            'years': sorted(self.years),
+            'teams': len(self.teams),
+            'owners': len(self.owner_codes),
+            'unresolved': sorted(self.owners.unresolved)
         }
-    
-    owner_totals[owner]['Total_Wins'] += int(record['Wins'])
-    owner_totals[owner]['Total_Losses'] += int(record['Losses'])
-    owner_totals[owner]['Total_Ties'] += int(record['Ties'])
-    owner_totals[owner]['Seasons_Played'] += 1
-    
-    # Track rank statistics
-    rank = int(record['Rank'])
-    owner_totals[owner]['Rank_Total'] += rank
-    
-    # Count achievements based on final rank
-    if rank == 1:
-        owner_totals[owner]['Championships'] += 1
-    if rank <= 2:
-        owner_totals[owner]['Finals'] += 1
-    if rank <= 4:
-        owner_totals[owner]['Playoffs'] += 1
-
-# Calculate additional stats
-for owner_data in owner_totals.values():
-    total_games = owner_data['Total_Wins'] + owner_data['Total_Losses'] + owner_data['Total_Ties']
-    owner_data['Total_Games'] = total_games
-    if total_games > 0:
-        owner_data['Win_Percentage'] = round(owner_data['Total_Wins'] / total_games, 3)
-    else:
-        owner_data['Win_Percentage'] = 0.0
-    
-    # Calculate rank statistics
-    if owner_data['Seasons_Played'] > 0:
-        owner_data['Average_Rank'] = round(owner_data['Rank_Total'] / owner_data['Seasons_Played'], 1)
-    else:
-        owner_data['Average_Rank'] = 0.0
-
-# Sort by win percentage (descending)
-aggregated_data = sorted(owner_totals.values(), key=lambda x: x['Win_Percentage'], reverse=True)
-
-# Write aggregated data to CSV
-overall_filename = '../data/ownersStandingsOverall.csv'
-with open(overall_filename, 'w', newline='', encoding='utf-8') as f:
-    fieldnames = ['Owner', 'Seasons_Played', 'Total_Games', 'Total_Wins', 'Total_Losses', 'Total_Ties', 'Win_Percentage', 'Average_Rank', 'Championships', 'Finals', 'Playoffs']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    
-    writer.writeheader()
-    for record in aggregated_data:
-        # Remove internal tracking fields before writing
-        output_record = {k: v for k, v in record.items() if k in fieldnames}
-        writer.writerow(output_record)
-
-print(f"Overall standings saved to: {overall_filename}")
-
-# Show summary statistics
-years = sorted(set(record['Year'] for record in merged_data))
-owners = sorted(set(record['Owner'] for record in merged_data))
-teams = sorted(set(record['Team'] for record in merged_data))
-
-print(f"\nSummary:")
-print(f"Years: {len(years)} ({years[0]} - {years[-1]})")
-print(f"Teams: {len(teams)}")
-print(f"Owners: {len(owners)}")
-print(f"Total records: {len(merged_data)}")
-
-# Show owner distribution
-owner_counts = {}
-for record in merged_data:
-    owner = record['Owner']
-    owner_counts[owner] = owner_counts.get(owner, 0) + 1
-
-print(f"\nRecords per owner:")
-for owner, count in sorted(owner_counts.items(), key=lambda x: x[1], reverse=True):
-    print(f"  {owner}: {count} records")
-
-print(f"\nSample merged data:")
-for i, record in enumerate(merged_data[:5]):
-    print(f"  {record['Year']}: #{record['Rank']} {record['Team']} ({record['Owner']}) - {record['Wins']}-{record['Losses']}-{record['Ties']}")
-
-print(f"\nOverall standings (by win percentage):")
-for i, record in enumerate(aggregated_data[:10]):  # Show top 10
-    print(f"  {i+1}. {record['Owner']}: {record['Total_Wins']}-{record['Total_Losses']}-{record['Total_Ties']} ({record['Win_Percentage']:.3f}) in {record['Seasons_Played']} seasons")
\ No newline at end of file
+
+    def aggregate(self):
+        """Return career totals per owner, sorted by win percentage"""
+        if self.backend == 'numpy':
+            import numpy as np
+
+            columns = {key: np.frombuffer(values, dtype=np.int64) for key, values in self.columns.items()}
+            return numpy_owner_totals(list(self.owner_codes), columns['Code'], columns['Wins'],
+                                      columns['Losses'], columns['Ties'], columns['Rank'])
+        return finish_owner_totals(self.owner_totals.values())
+
+def numpy_owner_totals(owners, codes, wins, losses, ties, ranks):
+    """Group typed per-row columns by owner code and build the owner totals"""
+    import numpy as np
+
+    group_count = len(owners)
+
+    def group_sum(values):
+        return np.bincount(codes, weights=values, minlength=group_count).astype(np.int64)
+
+    columns = {
+        'Total_Wins': group_sum(wins),
+        'Total_Losses': group_sum(losses),
+        'Total_Ties': group_sum(ties),
+        'Seasons_Played': np.bincount(codes, minlength=group_count),
+        'Rank_Total': group_sum(ranks),
+        'Championships': group_sum(ranks == 1),
+        'Finals': group_sum(ranks <= 2),
+        'Playoffs': group_sum(ranks <= 4)
+    }
+
+    owner_totals = []
+    for position, owner in enumerate(owners):
+        owner_data = {'Owner': owner}
+        for key, values in columns.items():
+            owner_data[key] = int(values[position])
+        owner_totals.append(owner_data)
+
+    return finish_owner_totals(owner_totals)
+
+def finish_owner_totals(owner_totals):
+    """Add games, win percentage and average rank to owner totals and sort them"""
+    # Calculate additional stats
+    for owner_data in owner_totals:
+        total_games = owner_data['Total_Wins'] + owner_data['Total_Losses'] + owner_data['Total_Ties']
+        owner_data['Total_Games'] = total_games
+        if total_games > 0:
+            owner_data['Win_Percentage'] = round(owner_data['Total_Wins'] / total_games, 3)
+        else:
+            owner_data['Win_Percentage'] = 0.0
+
+        # Calculate rank statistics
+        if owner_data['Seasons_Played'] > 0:
+            owner_data['Average_Rank'] = round(owner_data['Rank_Total'] / owner_data['Seasons_Played'], 1)
+        else:
+            owner_data['Average_Rank'] = 0.0
+
+    # Sort by win percentage (descending)
+    return sorted(owner_totals, key=lambda x: x['Win_Percentage'], reverse=True)
+
+def choose_backend(row_count):
+    """Pick NumPy for large histories when it is installed, otherwise the Python loop"""
+    if row_count < NUMPY_MIN_ROWS:
+        return 'python'
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return 'python'
+    return 'numpy'
+
+def write_merged_csv(merged_data, output_filename):
+    """Write merged standings to CSV"""
+    with open(output_filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=MERGED_FIELDNAMES)
+
+        writer.writeheader()
+        for record in merged_data:
+            writer.writerow(record)
+
+def write_overall_csv(aggregated_data, overall_filename):
+    """Write aggregated owner standings to CSV"""
+    with open(overall_filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=OVERALL_FIELDNAMES)
+
+        writer.writeheader()
+        for record in aggregated_data:
+            # Remove internal tracking fields before writing
+            output_record = {k: v for k, v in record.items() if k in OVERALL_FIELDNAMES}
+            writer.writerow(output_record)
+
+def log_unresolved(owners, label=''):
+    """Log teams matched only by alias, then every team without an owner in one warning"""
+    for team, mapped_team in sorted(owners.alias_matches.items()):
+        logger.warning(f"⚠️  {label + ' ' if label else ''}team {team!r} has no owner mapping of its own; "
+                       f"using the owner of {mapped_team!r}")
+    if not owners.unresolved:
+        return
+    teams = [f"{team} ({', '.join(years)})" if years else team for team, years in sorted(owners.unresolved.items())]
+    logger.warning(f"⚠️  {len(teams)} {label + ' ' if label else ''}teams have no owner (check the standings page and the owners mapping): "
+                   + '; '.join(teams))
+
+def log_merge_summary(accumulator, aggregated_data, label=''):
+    """Log summary statistics for the merged and aggregated standings, details at DEBUG"""
+    summary = accumulator.summary()
+    years = summary['years']
+
+    logger.info(f"\n{label.capitalize() + ' League ' if label else ''}Summary:")
+    logger.info(f"Years: {len(years)} ({years[0]} - {years[-1]})")
+    logger.info(f"Teams: {summary['teams']}")
+    logger.info(f"Owners: {summary['owners']}")
+    logger.info(f"Total records: {summary['records']}")
+    log_unresolved(accumulator.owners, label)
+
+    # Show owner distribution
+    logger.debug(f"\nRecords per owner:")
+    for owner, count in sorted(accumulator.owner_counts.items(), key=lambda x: x[1], reverse=True):
+        logger.debug(f"  {owner}: {count} records")
+
+    logger.debug(f"\nSample merged data:")
+    for record in accumulator.samples:
+        logger.debug(f"  {record['Year']}: #{record['Rank']} {record['Team']} ({record['Owner']}) - {record['Wins']}-{record['Losses']}-{record['Ties']}")
+
+    logger.debug(f"\nOverall {label + ' ' if label else ''}standings (by win percentage):")
+    for i, record in enumerate(aggregated_data[:10]):  # Show top 10
+        logger.debug(f"  {i+1}. {record['Owner']}: {record['Total_Wins']}-{record['Total_Losses']}-{record['Total_Ties']} ({record['Win_Percentage']:.3f}) in {record['Seasons_Played']} seasons")
+
+    best = aggregated_data[0] if aggregated_data else None
+    log_summary(logger, 'merge', dict(summary, best_performer=best and best['Owner'],
+                                      best_win_pct=best and best['Win_Percentage']))
+
+def backend_from_args(args):
+    """Pick the aggregation backend from command line flags (--numpy, --python)"""
+    for backend in AGGREGATION_BACKENDS:
+        if f'--{backend}' in args:
+            return backend
+    return 'auto'
+
+def merge_to_csv(standings, owners_map, output_csv, backend='python'):
+    """Stream standings rows through the merge into output_csv, returning the accumulator"""
+    accumulator = OwnerStandingsAccumulator(owners_map, backend)
+    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=MERGED_FIELDNAMES)
+
+        writer.writeheader()
+        for row in standings:
+            writer.writerow(accumulator.add(row))
+    return accumulator
+
+def run(owners_csv, standings_csv, output_csv, overall_csv, label='', backend='auto'):
+    """Merge standings with owners, write both CSVs and log a summary"""
+    name = label + ' ' if label else ''
+    if backend == 'auto':
+        # The row count is unknown until the stream ends; only use NumPy when asked to
+        backend = 'python'
+
+    # Read owners mapping
+    logger.info(f"Reading {name}owners mapping...")
+    owners_map = read_owners_map(owners_csv)
+    logger.info(f"Loaded {len(owners_map)} team-owner mappings")
+
+    # Stream raw standings through the merge into the merged CSV, accumulating
+    # the owner totals and summary statistics on the way
+    logger.info(f"Reading {name or 'raw '}standings and merging with owners...")
+    accumulator = merge_to_csv(iter_standings(standings_csv), owners_map, output_csv, backend)
+    logger.info(f"Merged {accumulator.record_count} records")
+    logger.info(f"Merged {name}standings saved to: {output_csv}")
+
+    # Create aggregated data across all seasons
+    logger.info(f"\nCreating overall aggregated {name}standings...")
+    aggregated_data = accumulator.aggregate()
+
+    # Write aggregated data to CSV
+    write_overall_csv(aggregated_data, overall_csv)
+    logger.info(f"Overall {name}standings saved to: {overall_csv}")
+
+    log_merge_summary(accumulator, aggregated_data, label)
+
+def main():
+    setup_logging(sys.argv[1:])
+    run(OWNERS_CSV, STANDINGS_CSV, OUTPUT_CSV, OVERALL_CSV, backend=backend_from_args(sys.argv[1:]))
+
+if __name__ == "__main__":
+    main()
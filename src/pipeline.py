@@ -0,0 +1,403 @@
+"""
+In-process executor for the league data and report pipeline
+
+Each stage is a plain function that reads its inputs from a shared in-memory
+state dict and stores its outputs there for the next stage, so a full run pays
+for one interpreter start-up and one set of imports. Writing the intermediate
+CSV files is optional; the HTML reports are always written. Every stage is
+timed so the end-to-end regeneration cost can be broken down.
+
+Stages declare the state keys they read (inputs) and produce (outputs). A
+stage depends on whichever stage of the same league produces one of its
+inputs; inputs nobody produces are read from disk by the stage itself. With
+jobs > 1 the scheduler runs every stage whose dependencies are done in a
+process pool, so independent chains (basketball and football) run at the same
+time. After the first failure no new stages are started, and the ones already
+running are allowed to finish.
+
+Stages also list the files they read (files) and write (products). When a
+Manifest is passed, a stage whose input files hash the same as on its last
+successful run, and whose products still exist, is skipped; downstream stages
+then read its products from disk.
+
+With ProfileOptions (see profiling.py), every stage that runs also records its
+CPU time, peak memory and row count in StageResult.profile.
+
+Paths are relative to the src directory, like the individual scripts.
+"""
+
+import importlib
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Callable, NamedTuple
+
+import fbOwnersStandings
+import fbStandings
+import owners
+import ownersStandings
+import rawStandings
+import report_engine
+from logs import log_summary
+from profiling import StageProfiler
+from standings_parser import SeasonCache, parse_standings, sort_standings, standings_summary, write_standings_csv
+
+logger = logging.getLogger(__name__)
+
+BASKETBALL = {
+    'name': 'Basketball',
+    'html_path': rawStandings.HTML_PATH,
+    'standings_csv': rawStandings.CSV_PATH,
+    'season_cache': rawStandings.SEASON_CACHE,
+    'owners_csv': ownersStandings.OWNERS_CSV,
+    'merged_csv': ownersStandings.OUTPUT_CSV,
+    'overall_csv': ownersStandings.OVERALL_CSV,
+    'report': 'StandingsReport',
+    'output_html': '../index.html'
+}
+
+FOOTBALL = {
+    'name': 'Football',
+    'html_path': fbStandings.HTML_PATH,
+    'standings_csv': fbStandings.CSV_PATH,
+    'season_cache': fbStandings.SEASON_CACHE,
+    'owners_csv': fbOwnersStandings.OWNERS_CSV,
+    'merged_csv': fbOwnersStandings.OUTPUT_CSV,
+    'overall_csv': fbOwnersStandings.OVERALL_CSV,
+    'report': 'FootballReport',
+    'output_html': '../fb_index.html'
+}
+
+class Stage(NamedTuple):
+    """One pipeline step: the script it replaces, the function that runs it and its data"""
+    name: str
+    description: str
+    run: Callable  # run(league, state, write_csv) -> summary dict
+    league: dict
+    inputs: tuple = ()
+    outputs: tuple = ()
+    files: tuple = ()
+    products: tuple = ()
+    options: dict = None  # settings besides the input files that change what the stage writes
+
+class StageResult(NamedTuple):
+    """Outcome and wall time of one executed stage"""
+    name: str
+    description: str
+    success: bool
+    seconds: float
+    summary: dict  # machine-readable counts reported by the stage (see logs.summary_lines)
+    error: str = ''
+    skipped: bool = False
+    profile: object = None  # StageProfile when profiling
+
+def extract_standings(league, state, write_csv):
+    """Parse the league history HTML into sorted standings rows"""
+    cache = SeasonCache(league['season_cache'], refresh=league.get('refresh_seasons', False))
+    rows = sort_standings(parse_standings(league['html_path'], cache=cache))
+    cache.save()
+    if write_csv:
+        write_standings_csv(rows, league['standings_csv'])
+    state['standings'] = [row._asdict() for row in rows]
+
+    return standings_summary(rows, cache)
+
+def write_owners_mapping(league, state, write_csv):
+    """Provide the hard-coded team-to-owner mapping from owners.py"""
+    if write_csv:
+        owners.write_owners_csv(owners.owner_mapping, league['owners_csv'])
+    state['owners_map'] = dict(owners.owner_mapping)
+
+    return {'mappings': len(owners.owner_mapping)}
+
+def merge_owner_standings(league, state, write_csv):
+    """Merge standings with owners and aggregate career totals"""
+    owners_map = state.get('owners_map')
+    if owners_map is None:
+        owners_map = ownersStandings.read_owners_map(league['owners_csv'])
+    standings = state.get('standings')
+    if standings is None:
+        standings = ownersStandings.read_standings(league['standings_csv'])
+
+    # Merge and aggregate in a single pass over the standings
+    backend = ownersStandings.choose_backend(len(standings))
+    accumulator = ownersStandings.OwnerStandingsAccumulator(owners_map, backend)
+    merged_data = [accumulator.add(row) for row in standings]
+    aggregated_data = accumulator.aggregate()
+    ownersStandings.log_unresolved(accumulator.owners, league['name'])
+    if write_csv:
+        ownersStandings.write_merged_csv(merged_data, league['merged_csv'])
+        ownersStandings.write_overall_csv(aggregated_data, league['overall_csv'])
+    state['merged'] = merged_data
+    state['overall'] = aggregated_data
+
+    return accumulator.summary()
+
+def render_report(league, state, write_csv):
+    """Render the league's HTML report from the merged and aggregated standings"""
+    config = importlib.import_module(league['report']).CONFIG
+    if 'overall' in state:
+        standings = report_engine.prepare_overall_standings(state['overall'])
+        detailed_standings = report_engine.prepare_detailed_standings(state['merged'])
+    else:
+        standings = report_engine.read_overall_standings(config.overall_csv)
+        detailed_standings = report_engine.read_detailed_standings(config.detailed_csv)
+
+    html_chunks, stats = report_engine.build_report(config, standings, detailed_standings,
+                                                    integrity=league.get('integrity', True))
+    report_engine.write_report(html_chunks, config.output_path)
+
+    return report_engine.report_summary(config, stats)
+
+def report_stages(league, script_names):
+    """Build the extract -> merge -> report stages for one league"""
+    name = league['name']
+    parse_script, merge_script, report_script = script_names
+    return [
+        Stage(parse_script, f"Extracting {name} League standings", extract_standings, league,
+              outputs=('standings',),
+              files=(league['html_path'], 'standings_parser.py', 'normalizer.py'),
+              products=(league['standings_csv'],)),
+        Stage(merge_script, f"Merging {name} owners and calculating stats", merge_owner_standings, league,
+              inputs=('standings', 'owners_map'), outputs=('merged', 'overall'),
+              files=(league['owners_csv'], league['standings_csv'], 'ownersStandings.py', 'normalizer.py'),
+              products=(league['merged_csv'], league['overall_csv'])),
+        Stage(report_script, f"Generating {name} League report", render_report, league,
+              inputs=('merged', 'overall'),
+              files=(league['merged_csv'], league['overall_csv'], f"{league['report']}.py",
+                     'report_engine.py', 'report_template.html', 'report.css', 'report.js'),
+              products=(league['output_html'],),
+              options={'integrity': league.get('integrity', True)})
+    ]
+
+def refresh_seasons(league):
+    """Return the league set up to re-parse every season instead of using its season cache"""
+    return dict(league, refresh_seasons=True)
+
+def without_integrity(league):
+    """Return the league set up to render its report without the Chart.js integrity hash"""
+    return dict(league, integrity=False)
+
+def owners_stage(league):
+    """Build the stage that provides the owners.py mapping to the merge stage"""
+    return Stage("owners.py", "Generate team-to-owner mapping CSV", write_owners_mapping, league,
+                 outputs=('owners_map',),
+                 files=('owners.py',),
+                 products=(league['owners_csv'],))
+
+def stage_rows(stage, state):
+    """Count the rows a stage produced, or consumed if it produced no row data"""
+    for key in stage.outputs + stage.inputs:
+        if key in state:
+            return len(state[key])
+    return None
+
+def run_stage(stage, state, write_csv=True, profile=None):
+    """Run one stage and return its StageResult without raising
+
+    profile is None, or the ProfileOptions to measure the stage with.
+    """
+    profiler = StageProfiler(_stage_key(stage), profile) if profile is not None else None
+    start = time.perf_counter()
+    try:
+        with profiler or nullcontext():
+            summary = stage.run(stage.league, state, write_csv)
+    except Exception as e:
+        return StageResult(stage.name, stage.description, False, time.perf_counter() - start, {}, f"{type(e).__name__}: {e}",
+                           profile=profiler and profiler.result(stage_rows(stage, state)))
+    return StageResult(stage.name, stage.description, True, time.perf_counter() - start, summary,
+                       profile=profiler and profiler.result(stage_rows(stage, state)))
+
+def _run_stage_task(stage, inputs, write_csv, profile=None):
+    """Run a stage on its declared inputs and return (StageResult, outputs)
+
+    This is the unit of work sent to pool workers, so everything it takes and
+    returns must be picklable.
+    """
+    state = dict(inputs)
+    result = run_stage(stage, state, write_csv, profile)
+    outputs = {key: state[key] for key in stage.outputs if key in state}
+    return result, outputs
+
+def stage_dependencies(stages):
+    """Map each stage index to the set of stage indices producing its inputs
+
+    Raises ValueError if two stages produce the same output or the stages
+    depend on each other in a cycle.
+    """
+    producers = {}
+    for index, stage in enumerate(stages):
+        for key in stage.outputs:
+            qualified = (stage.league['name'], key)
+            if qualified in producers:
+                raise ValueError(f"{stage.league['name']} {key} is produced by both {stages[producers[qualified]].name} and {stage.name}")
+            producers[qualified] = index
+
+    dependencies = {}
+    for index, stage in enumerate(stages):
+        dependencies[index] = {
+            producers[(stage.league['name'], key)]
+            for key in stage.inputs
+            if (stage.league['name'], key) in producers
+        }
+
+    topological_order(dependencies)
+    return dependencies
+
+def topological_order(dependencies):
+    """Return stage indices in dependency order, keeping the listed order for ties"""
+    order = []
+    done = set()
+    remaining = sorted(dependencies)
+    while remaining:
+        ready = [index for index in remaining if dependencies[index] <= done]
+        if not ready:
+            raise ValueError(f"Pipeline stages have a dependency cycle: {remaining}")
+        order.append(ready[0])
+        done.add(ready[0])
+        remaining.remove(ready[0])
+    return order
+
+def run_pipeline(stages, write_csv=True, jobs=1, manifest=None, on_start=None, on_result=None, profile=None):
+    """Run stages in dependency order, stopping at the first failure
+
+    Stages of the same league share one state dict, so data flows between them
+    in memory. With jobs > 1, stages whose dependencies are done run at the same
+    time in a pool of worker processes. With a manifest, stages whose input
+    files are unchanged are skipped; this needs write_csv, since downstream
+    stages compare the intermediate CSVs. on_start is called with each Stage
+    before it runs and on_result with its StageResult as soon as it finishes.
+    With profile (ProfileOptions), each result that ran carries its StageProfile.
+    Returns the StageResults in completion order.
+    """
+    dependencies = stage_dependencies(stages)
+    if not write_csv:
+        manifest = None
+
+    try:
+        if jobs > 1:
+            return _run_parallel(stages, dependencies, write_csv, jobs, manifest, on_start, on_result, profile)
+        return _run_serial(stages, dependencies, write_csv, manifest, on_start, on_result, profile)
+    finally:
+        if manifest is not None:
+            manifest.save()
+
+def _stage_inputs(stage, state):
+    """Pick the declared inputs of a stage out of its league's state"""
+    return {key: state[key] for key in stage.inputs if key in state}
+
+def _stage_key(stage):
+    return f"{stage.league['name']}:{stage.name}"
+
+def _check_fresh(stage, manifest):
+    """Return (skipped StageResult or None, input fingerprint) for a stage about to run"""
+    if manifest is None or not stage.files:
+        return None, None
+    key = _stage_key(stage)
+    if manifest.is_fresh(key, stage.files, stage.products, stage.options):
+        return StageResult(stage.name, stage.description, True, 0.0, {}, skipped=True), None
+    return None, manifest.fingerprint(stage.files)
+
+def _record_result(stage, result, fingerprint, manifest):
+    """Store the fingerprint of a stage that ran successfully"""
+    if manifest is not None and result.success and fingerprint is not None:
+        manifest.record(_stage_key(stage), fingerprint, stage.options)
+
+def _run_serial(stages, dependencies, write_csv, manifest, on_start, on_result, profile=None):
+    """Run every stage in this process, one at a time"""
+    states = {}
+    results = []
+    for index in topological_order(dependencies):
+        stage = stages[index]
+        state = states.setdefault(stage.league['name'], {})
+        result, fingerprint = _check_fresh(stage, manifest)
+        if result is None:
+            if on_start:
+                on_start(stage)
+            result, outputs = _run_stage_task(stage, _stage_inputs(stage, state), write_csv, profile)
+            state.update(outputs)
+            _record_result(stage, result, fingerprint, manifest)
+        results.append(result)
+        if on_result:
+            on_result(result)
+        if not result.success:
+            break
+    return results
+
+def _run_parallel(stages, dependencies, write_csv, jobs, manifest, on_start, on_result, profile=None):
+    """Schedule ready stages onto a process pool until all finish or one fails"""
+    states = {}
+    results = []
+    done = set()
+    pending = sorted(dependencies)
+    running = {}
+    failed = False
+
+    def finish(index, result, outputs):
+        nonlocal failed
+        states.setdefault(stages[index].league['name'], {}).update(outputs)
+        done.add(index)
+        results.append(result)
+        if on_result:
+            on_result(result)
+        if not result.success:
+            failed = True
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            ready = [index for index in pending if dependencies[index] <= done]
+            while ready and not failed:
+                index = ready.pop(0)
+                pending.remove(index)
+                stage = stages[index]
+                skipped, fingerprint = _check_fresh(stage, manifest)
+                if skipped:
+                    finish(index, skipped, {})
+                    # Stages that only waited on this one may be ready now
+                    ready = [index for index in pending if dependencies[index] <= done]
+                    continue
+                if on_start:
+                    on_start(stage)
+                state = states.setdefault(stage.league['name'], {})
+                future = pool.submit(_run_stage_task, stage, _stage_inputs(stage, state), write_csv, profile)
+                running[future] = (index, fingerprint)
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, fingerprint = running.pop(future)
+                stage = stages[index]
+                try:
+                    result, outputs = future.result()
+                except Exception as e:
+                    # The worker itself died or the stage could not be pickled
+                    result = StageResult(stage.name, stage.description, False, 0.0, {}, f"{type(e).__name__}: {e}")
+                    outputs = {}
+                _record_result(stage, result, fingerprint, manifest)
+                finish(index, result, outputs)
+
+    return results
+
+def log_timing_report(results, wall_seconds=None):
+    """Log wall time per stage and the share of the total
+
+    When stages ran in parallel, pass the elapsed wall_seconds of the whole run
+    to show it next to the summed stage time.
+    """
+    total = sum(result.seconds for result in results) or 1e-9
+    width = max(len(result.name) for result in results)
+    logger.info(f"\n⏱️  Stage timings:")
+    for result in results:
+        status = '-' if result.skipped else '✓' if result.success else '✗'
+        logger.info(f"   {status} {result.name:<{width}}  {result.seconds * 1000:8.1f} ms  {result.seconds / total:6.1%}")
+    logger.info(f"   {'Total':<{width + 2}}  {total * 1000:8.1f} ms")
+    if wall_seconds is not None:
+        logger.info(f"   {'Wall clock':<{width + 2}}  {wall_seconds * 1000:8.1f} ms")
+
+def log_stage_result(result):
+    """Log a finished stage's summary dict as a machine-readable record"""
+    log_summary(logger, result.name, dict(result.summary, description=result.description, success=result.success,
+                                          skipped=result.skipped, seconds=result.seconds, error=result.error or None))
@@ -0,0 +1,199 @@
+"""
+Per-stage profiling for the pipeline
+
+A StageProfiler wraps one stage and records its wall time, CPU time, peak
+memory and the number of rows it processed. Peak memory is measured per stage:
+with tracemalloc on, it is the peak of traced Python allocations while the
+stage ran; otherwise the kernel's resident set high-water mark is reset when
+the stage starts (Linux /proc/self/clear_refs) and the stage reports how far
+its peak rose above the RSS it started with. Only where that reset is not
+available does it fall back to the peak RSS of the whole process so far,
+which is the same for every stage in a process. Optionally each stage also
+runs under cProfile, with its stats saved as <league>-<stage>.prof for pstats
+or snakeviz.
+
+write_chrome_trace() saves the profiles as Chrome trace-event JSON, which
+chrome://tracing and https://ui.perfetto.dev can display as a timeline.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import NamedTuple
+
+from logs import log_summary
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = '../data/profile'
+MEMORY_MARKS = {'rss': '+', 'process-rss': '*'}
+
+class ProfileOptions(NamedTuple):
+    """Which profilers to run for each stage and where to write their output"""
+    cprofile: bool = False
+    tracemalloc: bool = False
+    output_dir: str = PROFILE_DIR
+
+class StageProfile(NamedTuple):
+    """Resources used by one stage"""
+    name: str
+    start: float              # seconds since the epoch
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_mb: float     # None if it cannot be measured on this platform
+    memory_source: str        # 'tracemalloc', 'rss' (stage peak above its start) or 'process-rss'
+    rows: int                 # None if the stage has no row data
+    pid: int
+    cprofile_path: str = None
+
+def peak_rss_mb():
+    """Return the peak resident set size of this process so far in MB, or None if unknown"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def read_rss_status_mb():
+    """Return (current RSS, RSS high-water mark) in MB from /proc/self/status, or None"""
+    try:
+        with open('/proc/self/status', 'r', encoding='utf-8') as f:
+            status = f.read()
+    except OSError:
+        return None
+    values = dict(re.findall(r'^(VmRSS|VmHWM):\s+(\d+) kB', status, re.MULTILINE))
+    if len(values) < 2:
+        return None
+    return int(values['VmRSS']) / 1024, int(values['VmHWM']) / 1024
+
+def reset_peak_rss():
+    """Reset the RSS high-water mark of this process; return the current RSS in MB, or None"""
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='utf-8') as f:
+            f.write('5')
+    except OSError:
+        return None
+    status = read_rss_status_mb()
+    return status and status[0]
+
+def profile_file_name(name):
+    """Turn a stage name like 'Basketball:rawStandings.py' into a safe file name"""
+    return re.sub(r'[^A-Za-z0-9_.-]+', '-', name)
+
+class StageProfiler:
+    """Context manager measuring one stage; call result() once it has exited"""
+
+    def __init__(self, name, options):
+        self.name = name
+        self.options = options
+        self.profiler = None
+        self.cprofile_path = None
+        self.traced = False
+        self.start_rss_mb = None
+
+    def __enter__(self):
+        if self.options.tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.traced = True
+        elif not self.options.tracemalloc:
+            self.start_rss_mb = reset_peak_rss()
+        if self.options.cprofile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self.start = time.time()
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wall_seconds = time.perf_counter() - self.wall_start
+        self.cpu_seconds = time.process_time() - self.cpu_start
+        if self.profiler is not None:
+            self.profiler.disable()
+            Path(self.options.output_dir).mkdir(parents=True, exist_ok=True)
+            self.cprofile_path = str(Path(self.options.output_dir) / f"{profile_file_name(self.name)}.prof")
+            self.profiler.dump_stats(self.cprofile_path)
+        status = read_rss_status_mb() if self.start_rss_mb is not None else None
+        if self.traced:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.peak_memory_mb = peak / (1024 * 1024)
+            self.memory_source = 'tracemalloc'
+        elif status is not None:
+            self.peak_memory_mb = max(status[1] - self.start_rss_mb, 0.0)
+            self.memory_source = 'rss'
+        else:
+            self.peak_memory_mb = peak_rss_mb()
+            self.memory_source = 'process-rss'
+        return False
+
+    def result(self, rows=None):
+        """Return the StageProfile of the finished stage"""
+        return StageProfile(self.name, self.start, self.wall_seconds, self.cpu_seconds, self.peak_memory_mb,
+                            self.memory_source, rows, os.getpid(), self.cprofile_path)
+
+def chrome_trace_events(profiles, extra_events=()):
+    """Convert StageProfiles (and (name, start, seconds) spans) into Chrome trace events"""
+    spans = [(profile.name, profile.start, profile.wall_seconds, profile.pid, {
+        'cpu_ms': round(profile.cpu_seconds * 1000, 3),
+        'peak_memory_mb': profile.peak_memory_mb,
+        'memory_source': profile.memory_source,
+        'rows': profile.rows
+    }) for profile in profiles]
+    spans += [(name, start, seconds, os.getpid(), {}) for name, start, seconds in extra_events]
+    origin = min((start for _, start, _, _, _ in spans), default=0)
+
+    events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': f"pipeline worker {pid}"}}
+              for pid in sorted({pid for _, _, _, pid, _ in spans})]
+    for name, start, seconds, pid, args in spans:
+        events.append({
+            'name': name,
+            'cat': 'stage',
+            'ph': 'X',
+            'ts': round((start - origin) * 1e6),
+            'dur': round(seconds * 1e6),
+            'pid': pid,
+            'tid': pid,
+            'args': args
+        })
+    return events
+
+def write_chrome_trace(profiles, path, extra_events=()):
+    """Write the profiles as a Chrome trace-event JSON file"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': chrome_trace_events(profiles, extra_events), 'displayTimeUnit': 'ms'}, f, indent=1)
+
+def log_profile_report(profiles):
+    """Log wall time, CPU time, peak memory and throughput per profiled stage, then a summary record"""
+    width = max((len(profile.name) for profile in profiles), default=5)
+    logger.info(f"\n🔬 Stage profile:")
+    logger.info(f"   {'Stage':<{width}}  {'Wall':>10}  {'CPU':>10}  {'Peak mem':>10}  {'Rows':>8}  {'Rows/s':>11}")
+    for profile in profiles:
+        memory = '-' if profile.peak_memory_mb is None else f"{profile.peak_memory_mb:.1f} MB"
+        if profile.peak_memory_mb is not None:
+            memory += MEMORY_MARKS.get(profile.memory_source, '')
+        rows = '-' if profile.rows is None else f"{profile.rows:,}"
+        rate = f"{profile.rows / profile.wall_seconds:,.0f}" if profile.rows and profile.wall_seconds > 0 else '-'
+        logger.info(f"   {profile.name:<{width}}  {profile.wall_seconds * 1000:8.1f}ms  {profile.cpu_seconds * 1000:8.1f}ms"
+                    f"  {memory:>10}  {rows:>8}  {rate:>11}")
+    sources = {profile.memory_source for profile in profiles}
+    if 'rss' in sources:
+        logger.info("   + rise of the peak RSS above the RSS at the start of the stage")
+    if 'process-rss' in sources:
+        logger.info("   * peak RSS of the process so far (use --tracemalloc for per-stage Python allocations)")
+    for profile in profiles:
+        if profile.cprofile_path:
+            logger.info(f"   cProfile {profile.name}: {profile.cprofile_path}")
+    log_summary(logger, 'profile', {'stages': [profile._asdict() for profile in profiles]})
@@ -0,0 +1,868 @@
+
+        // Sortable tables drawn from column data: each column's sort key is computed once,
+        // sorting only reorders an index array, and inside a scroll container only the rows
+        // in view (plus an overscan margin) are put in the DOM
+        const VIRTUAL_MIN_ROWS = 100;
+        const VIRTUAL_OVERSCAN = 10;
+        
+        function escapeHtml(text) {
+            const entities = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+            return String(text).replace(/[&<>"']/g, c => entities[c]);
+        }
+        
+        function winPctClass(winPct) {
+            if (winPct >= 0.600) return 'excellent';
+            if (winPct >= 0.550) return 'good';
+            if (winPct >= 0.500) return 'average';
+            if (winPct >= 0.450) return 'below-average';
+            return 'poor';
+        }
+        
+        // Numeric columns sort on their values, text columns on each value's rank among
+        // the distinct values, so the sort itself never compares strings
+        function sortKeys(column, rowCount) {
+            const values = Array.from({ length: rowCount }, (_, i) => column.value(i));
+            if (column.type === 'number') {
+                return Float64Array.from(values);
+            }
+            const ranks = new Map([...new Set(values)].sort((a, b) => a.localeCompare(b))
+                .map((value, rank) => [value, rank]));
+            return Int32Array.from(values, value => ranks.get(value));
+        }
+        
+        function numberColumn(values, digits = null) {
+            return {
+                type: 'number',
+                value: i => values[i],
+                cell: i => `<td>${digits === null ? values[i] : values[i].toFixed(digits)}</td>`
+            };
+        }
+        
+        // columns[i] describes header cell i: cell(row, position) returns its <td>, and
+        // sortable columns also have a type ('number' or 'text') and value(row)
+        function createDataTable(tableId, columns, rowCount, scrollerId = null) {
+            const table = document.getElementById(tableId);
+            const tbody = table.tBodies[0];
+            const headers = Array.from(table.tHead.rows[0].cells);
+            const scroller = scrollerId && rowCount >= VIRTUAL_MIN_ROWS ? document.getElementById(scrollerId) : null;
+            const keys = columns.map(() => null);
+            const order = Uint32Array.from({ length: rowCount }, (_, i) => i);
+            let sortColumn = -1;
+            let ascending = true;
+            let rowHeight = 0;
+            
+            function spacer(height) {
+                return `<tr class="spacer"><td colspan="${columns.length}" style="height: ${height}px"></td></tr>`;
+            }
+            
+            function render() {
+                let start = 0;
+                let end = rowCount;
+                if (scroller && rowHeight) {
+                    start = Math.max(0, Math.floor(scroller.scrollTop / rowHeight) - VIRTUAL_OVERSCAN);
+                    end = Math.min(rowCount, Math.ceil((scroller.scrollTop + scroller.clientHeight) / rowHeight) + VIRTUAL_OVERSCAN);
+                } else if (scroller) {
+                    end = Math.min(rowCount, VIRTUAL_OVERSCAN);  // First pass, to measure the row height
+                }
+                
+                const html = [];
+                if (start > 0) {
+                    html.push(spacer(start * rowHeight));
+                    // Keep each row's position parity so the striping does not flicker while scrolling
+                    if (start % 2 === 0) html.push('<tr class="spacer"></tr>');
+                }
+                for (let position = start; position < end; position++) {
+                    const row = order[position];
+                    html.push('<tr>' + columns.map(column => column.cell(row, position)).join('') + '</tr>');
+                }
+                if (end < rowCount) html.push(spacer((rowCount - end) * rowHeight));
+                tbody.innerHTML = html.join('');
+            }
+            
+            function sortBy(columnIndex) {
+                ascending = columnIndex === sortColumn ? !ascending : true;
+                sortColumn = columnIndex;
+                const key = keys[columnIndex] || (keys[columnIndex] = sortKeys(columns[columnIndex], rowCount));
+                order.sort(ascending ? (a, b) => key[a] - key[b] || a - b : (a, b) => key[b] - key[a] || a - b);
+                
+                // Move the sort indicator to this column
+                headers.forEach(header => {
+                    header.classList.remove('sort-asc', 'sort-desc');
+                    header.textContent = header.textContent.replace(/ [▲▼]/g, '');
+                });
+                headers[columnIndex].textContent += ascending ? ' ▲' : ' ▼';
+                headers[columnIndex].classList.add(ascending ? 'sort-asc' : 'sort-desc');
+                render();
+            }
+            
+            headers.forEach((header, index) => {
+                if (!columns[index].type) return;  // Position column
+                
+                header.style.cursor = 'pointer';
+                header.style.userSelect = 'none';
+                header.title = 'Click to sort';
+                header.addEventListener('click', () => sortBy(index));
+            });
+            
+            if (scroller) {
+                // Measure one row, then keep the window in step with the scroll position
+                render();
+                rowHeight = (tbody.rows[0] && tbody.rows[0].offsetHeight) || 41;
+                let pending = false;
+                scroller.addEventListener('scroll', () => {
+                    if (pending) return;
+                    pending = true;
+                    requestAnimationFrame(() => {
+                        pending = false;
+                        render();
+                    });
+                }, { passive: true });
+            }
+            render();
+        }
+        
+        // Career standings table, in standings order until a header is clicked
+        function initCareerTable(data) {
+            createDataTable('careerTable', [
+                { cell: (row, position) => `<td class="rank">#${position + 1}</td>` },
+                { type: 'text', value: i => data.owner[i], cell: i => `<td class="owner-name">${escapeHtml(data.owner[i])}</td>` },
+                numberColumn(data.seasons),
+                {
+                    type: 'number',
+                    value: i => data.wins[i],  // Records sort by wins
+                    cell: i => `<td class="record">${data.wins[i]}-${data.losses[i]}-${data.ties[i]}</td>`
+                },
+                {
+                    type: 'number',
+                    value: i => data.win_pct[i],
+                    cell: i => `<td><span class="win-pct ${winPctClass(data.win_pct[i])}">${data.win_pct[i].toFixed(3)}</span></td>`
+                },
+                numberColumn(data.average_rank, 1),
+                numberColumn(data.championships),
+                numberColumn(data.finals),
+                numberColumn(data.playoffs),
+                numberColumn(data.total_games)
+            ], data.owner.length);
+        }
+        
+        // Season-by-season results table, virtualized inside its scroll container
+        function initSeasonTable(data) {
+            const rows = data.rows;
+            const winPct = Float64Array.from(rows.wins, (wins, i) => {
+                const totalGames = wins + rows.losses[i] + rows.ties[i];
+                return totalGames > 0 ? wins / totalGames : 0;
+            });
+            createDataTable('seasonTable', [
+                { cell: (row, position) => `<td class="rank">${position + 1}</td>` },
+                numberColumn(rows.year),
+                { type: 'text', value: i => data.teams[rows.team[i]], cell: i => `<td>${escapeHtml(data.teams[rows.team[i]])}</td>` },
+                {
+                    type: 'text',
+                    value: i => data.owners[rows.owner[i]],
+                    cell: i => `<td class="owner-name">${escapeHtml(data.owners[rows.owner[i]])}</td>`
+                },
+                numberColumn(rows.rank),
+                {
+                    type: 'number',
+                    value: i => rows.wins[i],
+                    cell: i => `<td class="record">${rows.wins[i]}-${rows.losses[i]}-${rows.ties[i]}</td>`
+                },
+                {
+                    type: 'number',
+                    value: i => winPct[i],
+                    cell: i => `<td><span class="win-pct ${winPctClass(winPct[i])}">${winPct[i].toFixed(3)}</span></td>`
+                }
+            ], rows.year.length, 'seasonTableScroll');
+        }
+        
+        // Chart and table payloads in their compact wire format (expanded by payloadExpanders
+        // below): embedded objects, or URLs fetched when their chart or table scrolls into view
+        const reportPayloads = {{ report_payloads }};
+        
+        // Wins by year chart, and each dataset's cached styles and current highlight state
+        let winsChart = null;
+        let winsChartStyles = [];
+        let winsChartStates = [];
+        
+        function initWinsChart(chartData) {
+            // Create the chart
+            const ctx = document.getElementById('winsChart').getContext('2d');
+            winsChart = new Chart(ctx, {
+                type: 'line',
+                data: chartData,
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    animation: chartData.downsampled ? false : {},
+                    plugins: {
+                        title: {
+                            display: true,
+                            text: 'Wins by Year Trends (Veterans: 5+ Seasons)',
+                            font: {
+                                size: 16,
+                                weight: 'bold'
+                            }
+                        },
+                        legend: {
+                            display: true,
+                            position: 'bottom',
+                            labels: {
+                                usePointStyle: true,
+                                padding: 10,
+                                fontSize: 12
+                            }
+                        },
+                        tooltip: {
+                            mode: 'index',
+                            intersect: false,
+                            // Downsampled series have gaps for seasons that were played but not drawn
+                            filter: item => !chartData.downsampled || item.parsed.y !== null,
+                            callbacks: {
+                                title: function(context) {
+                                    return 'Year: ' + context[0].label;
+                                },
+                                label: function(context) {
+                                    if (context.parsed.y === null) {
+                                        return context.dataset.label + ': Did not play';
+                                    }
+                                    return context.dataset.label + ': ' + context.parsed.y + ' wins';
+                                }
+                            }
+                        }
+                    },
+                    interaction: {
+                        mode: 'index',
+                        intersect: false,
+                    },
+                    scales: {
+                        x: {
+                            display: true,
+                            title: {
+                                display: true,
+                                text: 'Year',
+                                font: {
+                                    size: 14,
+                                    weight: 'bold'
+                                }
+                            },
+                            grid: {
+                                display: true,
+                                color: 'rgba(0,0,0,0.1)'
+                            }
+                        },
+                        y: {
+                            display: true,
+                            title: {
+                                display: true,
+                                text: 'Wins',
+                                font: {
+                                    size: 14,
+                                    weight: 'bold'
+                                }
+                            },
+                            beginAtZero: true,
+                            grid: {
+                                display: true,
+                                color: 'rgba(0,0,0,0.1)'
+                            }
+                        }
+                    },
+                    elements: {
+                        point: {
+                            radius: 4,
+                            hoverRadius: 6
+                        },
+                        line: {
+                            borderWidth: 2,
+                            hoverBorderWidth: 3
+                        }
+                    }
+                }
+            });
+            
+            // Cache every dataset's style for each highlight state
+            winsChartStyles = winsChart.data.datasets.map(dataset => ({
+                normal: {
+                    borderWidth: 2,
+                    pointRadius: 4,
+                    pointHoverRadius: 6,
+                    borderColor: dataset.borderColor,
+                    backgroundColor: dataset.backgroundColor
+                },
+                highlighted: {
+                    borderWidth: 4,
+                    pointRadius: 6,
+                    pointHoverRadius: 8,
+                    borderColor: dataset.borderColor,
+                    backgroundColor: dataset.backgroundColor
+                },
+                dimmed: {
+                    borderWidth: 1,
+                    pointRadius: 2,
+                    pointHoverRadius: 4,
+                    borderColor: 'rgba(150, 150, 150, 0.3)',
+                    backgroundColor: 'rgba(150, 150, 150, 0.1)'
+                }
+            }));
+            winsChartStates = winsChart.data.datasets.map(() => null);
+            
+            // Populate the dropdown with team names
+            const teamSelect = document.getElementById('teamHighlight');
+            const allTeams = winsChart.data.datasets.map(dataset => dataset.label).sort();
+            
+            allTeams.forEach(teamName => {
+                const option = document.createElement('option');
+                option.value = teamName;
+                option.textContent = teamName;
+                teamSelect.appendChild(option);
+            });
+        }
+        
+        // Function to highlight a specific team; only datasets whose state changes are restyled
+        function highlightTeam(teamName) {
+            if (!winsChart) return;  // Chart not loaded yet
+            
+            const showAll = teamName === 'None' || teamName === '';
+            let changed = 0;
+            winsChart.data.datasets.forEach((dataset, index) => {
+                const state = showAll ? 'normal' : dataset.label === teamName ? 'highlighted' : 'dimmed';
+                if (winsChartStates[index] !== state) {
+                    Object.assign(dataset, winsChartStyles[index][state]);
+                    winsChartStates[index] = state;
+                    changed++;
+                }
+            });
+            
+            if (changed > 0) {
+                winsChart.update('none');
+            }
+        }
+        
+        // Winning percentage by rank chart
+        function initBoxplotChart(boxplotData) {
+            // Create boxplot chart
+            const boxplotCtx = document.getElementById('boxplotChart').getContext('2d');
+            
+            // Prepare data for mean lines and beeswarm
+            const boxplotDatasets = [];
+            
+            boxplotData.labels.forEach((label, index) => {
+                const data = boxplotData.data[index];
+            
+                // Vertical line for mean
+                boxplotDatasets.push({
+                    label: label + ' (Mean)',
+                    data: [
+                        {x: index - 0.4, y: data.mean},
+                        {x: index + 0.4, y: data.mean}
+                    ],
+                    type: 'line',
+                    borderColor: '#2196F3',
+                    backgroundColor: '#2196F3',
+                    fill: false,
+                    pointRadius: 0,
+                    borderWidth: 3,
+                    showLine: true
+                });
+            });
+            
+            // Add beeswarm overlay points
+            boxplotDatasets.push({
+                label: 'Individual Seasons',
+                data: boxplotData.beeswarm.map(point => ({
+                    x: point.x,
+                    y: point.y,
+                    team: point.team,
+                    owner: point.owner,
+                    year: point.year,
+                    record: point.record,
+                    rank: point.rank
+                })),
+                type: 'scatter',
+                borderColor: 'rgba(76, 175, 80, 0.5)',
+                backgroundColor: 'rgba(76, 175, 80, 0.5)',
+                pointRadius: 3,
+                pointHoverRadius: 5,
+                pointStyle: 'circle',
+                borderWidth: 0
+            });
+            
+            // Custom plugin to add mean value annotations
+            const meanAnnotationPlugin = {
+                id: 'meanAnnotations',
+                afterDraw: function(chart) {
+                    const ctx = chart.ctx;
+                    const chartArea = chart.chartArea;
+                
+                    boxplotData.labels.forEach((label, index) => {
+                        const mean = boxplotData.data[index].mean;
+                        const x = chart.scales.x.getPixelForValue(index);
+                        const y = chart.scales.y.getPixelForValue(mean);
+                    
+                        // Draw text annotation
+                        ctx.save();
+                        ctx.fillStyle = '#333';
+                        ctx.font = 'bold 12px Arial';
+                        ctx.textAlign = 'center';
+                        ctx.textBaseline = 'bottom';
+                        const text = (mean * 100).toFixed(1) + '%';
+                        ctx.fillText(text, x, y - 10);
+                        ctx.restore();
+                    });
+                }
+            };
+            
+            const boxplotChart = new Chart(boxplotCtx, {
+                type: 'scatter',
+                data: {
+                    datasets: boxplotDatasets
+                },
+                plugins: [meanAnnotationPlugin],
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        title: {
+                            display: true,
+                            text: 'Mean Winning Percentage by Final Rank',
+                            font: {
+                                size: 16,
+                                weight: 'bold'
+                            }
+                        },
+                        legend: {
+                            display: false
+                        },
+                        tooltip: {
+                            callbacks: {
+                                title: function(context) {
+                                    const point = context[0];
+                                    // Check if this is a beeswarm point (last dataset)
+                                    if (point.datasetIndex === boxplotDatasets.length - 1) {
+                                        const dataPoint = point.raw;
+                                        return `${dataPoint.team} (${dataPoint.owner}) - ${dataPoint.year}`;
+                                    }
+                                    return boxplotData.labels[Math.round(point.parsed.x)];
+                                },
+                                label: function(context) {
+                                    // Check if this is a beeswarm point (last dataset)
+                                    if (context.datasetIndex === boxplotDatasets.length - 1) {
+                                        const dataPoint = context.raw;
+                                        return [
+                                            `Record: ${dataPoint.record}`,
+                                            `Win %: ${(dataPoint.y * 100).toFixed(1)}%`,
+                                            `Final Rank: ${dataPoint.rank}`
+                                        ];
+                                    }
+                                
+                                    // This is a mean line
+                                    const dataPoint = boxplotData.data[Math.round(context.parsed.x)];
+                                    if (!dataPoint) return '';
+                                
+                                    return `Mean: ${(dataPoint.mean * 100).toFixed(1)}% (${dataPoint.count} seasons)`;
+                                }
+                            }
+                        }
+                    },
+                    scales: {
+                        x: {
+                            type: 'linear',
+                            position: 'bottom',
+                            title: {
+                                display: true,
+                                text: 'Final Rank',
+                                font: {
+                                    size: 14,
+                                    weight: 'bold'
+                                }
+                            },
+                            ticks: {
+                                callback: function(value, index, values) {
+                                    return boxplotData.labels[value] || '';
+                                },
+                                stepSize: 1
+                            },
+                            grid: {
+                                display: true,
+                                color: 'rgba(0,0,0,0.1)'
+                            }
+                        },
+                        y: {
+                            title: {
+                                display: true,
+                                text: 'Winning Percentage',
+                                font: {
+                                    size: 14,
+                                    weight: 'bold'
+                                }
+                            },
+                            ticks: {
+                                callback: function(value) {
+                                    return (value * 100).toFixed(0) + '%';
+                                }
+                            },
+                            grid: {
+                                display: true,
+                                color: 'rgba(0,0,0,0.1)'
+                            }
+                        }
+                    }
+                }
+            });
+        }
+        
+        // Playoff slider lookup table: playoff teams and total teams with win% >= each
+        // slider position, indexed by position (win% * resolution)
+        let playoffSlider = null;
+        
+        // Playoff Probability Calculator
+        function updatePlayoffProbability() {
+            const slider = document.getElementById('winPctSlider');
+            const winPct = parseFloat(slider.value);
+            
+            // Update display
+            document.getElementById('winPctDisplay').textContent = winPct.toFixed(1) + '%';
+            
+            // Look up the cumulative playoff percentage for win% >= slider value
+            const index = Math.round(winPct * playoffSlider.resolution);
+            const teams = playoffSlider.teams[index];
+            const result = {
+                probability: teams > 0 ? playoffSlider.playoffs[index] / teams : 0,
+                sample_size: teams
+            };
+            
+            const probability = (result.probability * 100).toFixed(1);
+            
+            // Update probability display
+            document.getElementById('playoffProbability').textContent = probability + '%';
+            
+            // Update color based on probability
+            const probElement = document.getElementById('playoffProbability');
+            if (result.probability >= 0.75) {
+                probElement.style.color = '#4CAF50'; // Green
+            } else if (result.probability >= 0.50) {
+                probElement.style.color = '#FF9800'; // Orange
+            } else if (result.probability >= 0.25) {
+                probElement.style.color = '#FF5722'; // Red-orange
+            } else {
+                probElement.style.color = '#F44336'; // Red
+            }
+            
+            // Update sample size and message
+            if (result.sample_size > 0) {
+                document.getElementById('sampleSize').textContent = 
+                    `Based on ${result.sample_size} team${result.sample_size === 1 ? '' : 's'} with ≥${winPct.toFixed(1)}% win rate`;
+            } else {
+                document.getElementById('sampleSize').textContent = 'No historical data available';
+            }
+            
+            // Update message to clarify it's for >= win%
+            document.getElementById('playoffMessage').textContent = 
+                `Chance of playoffs with ≥${winPct.toFixed(1)}% win rate`;
+        }
+        
+        function initPlayoffCalculator(table) {
+            playoffSlider = table;
+            
+            // Initialize slider
+            document.getElementById('winPctSlider').addEventListener('input', updatePlayoffProbability);
+            updatePlayoffProbability(); // Initial calculation
+        }
+        
+        // Cumulative playoff chart
+        function initCumulativePlayoffChart(cumulativePlayoffData) {
+            // Create cumulative playoff chart
+            const cumulativeCtx = document.getElementById('cumulativePlayoffChart').getContext('2d');
+            
+            // Prepare data for cumulative chart
+            const cumulativeChartData = {
+                labels: cumulativePlayoffData.map(d => (d.threshold * 100).toFixed(0)),
+                datasets: [{
+                    label: 'Playoff Percentage',
+                    data: cumulativePlayoffData.map(d => d.playoff_percentage * 100),
+                    borderColor: '#2196F3',
+                    backgroundColor: 'rgba(33, 150, 243, 0.1)',
+                    fill: true,
+                    tension: 0.4,
+                    borderWidth: 3,
+                    pointRadius: 2,
+                    pointHoverRadius: 5,
+                    pointBackgroundColor: '#2196F3',
+                    pointBorderColor: '#fff',
+                    pointBorderWidth: 2
+                }]
+            };
+            
+            // Custom plugin to add annotations at key thresholds
+            const cumulativeAnnotationPlugin = {
+                id: 'cumulativeAnnotations',
+                afterDraw: function(chart) {
+                    const ctx = chart.ctx;
+                    const chartArea = chart.chartArea;
+                
+                    // Annotation thresholds (40%, 50%, 60%)
+                    const thresholds = [40, 50, 60];
+                
+                    thresholds.forEach(threshold => {
+                        // Find the corresponding data point
+                        const dataPoint = cumulativePlayoffData.find(d => Math.round(d.threshold * 100) === threshold);
+                        if (dataPoint) {
+                            const x = chart.scales.x.getPixelForValue(threshold);
+                            const y = chart.scales.y.getPixelForValue(dataPoint.playoff_percentage * 100);
+                        
+                            // Draw annotation
+                            ctx.save();
+                        
+                            // Draw vertical line
+                            ctx.strokeStyle = 'rgba(255, 87, 34, 0.8)';
+                            ctx.lineWidth = 2;
+                            ctx.setLineDash([5, 5]);
+                            ctx.beginPath();
+                            ctx.moveTo(x, chartArea.top);
+                            ctx.lineTo(x, y);
+                            ctx.stroke();
+                            ctx.setLineDash([]);
+                        
+                            // Draw horizontal line
+                            ctx.beginPath();
+                            ctx.moveTo(chartArea.left, y);
+                            ctx.lineTo(x, y);
+                            ctx.stroke();
+                        
+                            // Draw point
+                            ctx.fillStyle = '#FF5722';
+                            ctx.strokeStyle = '#fff';
+                            ctx.lineWidth = 3;
+                            ctx.beginPath();
+                            ctx.arc(x, y, 6, 0, 2 * Math.PI);
+                            ctx.fill();
+                            ctx.stroke();
+                        
+                            // Add text annotation
+                            ctx.fillStyle = '#333';
+                            ctx.font = 'bold 12px Arial';
+                            ctx.textAlign = 'center';
+                            ctx.textBaseline = 'bottom';
+                            const percentage = (dataPoint.playoff_percentage * 100).toFixed(1) + '%';
+                            ctx.fillText(percentage, x, y - 15);
+                        
+                            // Add threshold label
+                            ctx.fillStyle = '#666';
+                            ctx.font = '11px Arial';
+                            ctx.textBaseline = 'top';
+                            ctx.fillText(threshold + '%', x, chartArea.bottom + 5);
+                        
+                            ctx.restore();
+                        }
+                    });
+                }
+            };
+            
+            const cumulativeChart = new Chart(cumulativeCtx, {
+                type: 'line',
+                data: cumulativeChartData,
+                plugins: [cumulativeAnnotationPlugin],
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        title: {
+                            display: true,
+                            text: 'Playoff Percentage for Teams with Win% ≥ Threshold',
+                            font: {
+                                size: 16,
+                                weight: 'bold'
+                            }
+                        },
+                        legend: {
+                            display: false
+                        },
+                        tooltip: {
+                            callbacks: {
+                                title: function(context) {
+                                    return `Win Percentage ≥ ${context[0].label}%`;
+                                },
+                                label: function(context) {
+                                    const dataIndex = context.dataIndex;
+                                    const totalTeams = cumulativePlayoffData[dataIndex].total_teams;
+                                    return [
+                                        `Playoff Rate: ${context.parsed.y.toFixed(1)}%`,
+                                        `Sample Size: ${totalTeams} team${totalTeams === 1 ? '' : 's'}`
+                                    ];
+                                }
+                            }
+                        }
+                    },
+                    scales: {
+                        x: {
+                            title: {
+                                display: true,
+                                text: 'Minimum Win Percentage (%)',
+                                font: {
+                                    size: 14,
+                                    weight: 'bold'
+                                }
+                            },
+                            grid: {
+                                display: true,
+                                color: 'rgba(0,0,0,0.1)'
+                            },
+                            ticks: {
+                                maxTicksLimit: 11,
+                                callback: function(value, index) {
+                                    return value % 10 === 0 ? value + '%' : '';
+                                }
+                            }
+                        },
+                        y: {
+                            title: {
+                                display: true,
+                                text: 'Playoff Percentage (%)',
+                                font: {
+                                    size: 14,
+                                    weight: 'bold'
+                                }
+                            },
+                            min: 0,
+                            max: 100,
+                            grid: {
+                                display: true,
+                                color: 'rgba(0,0,0,0.1)'
+                            },
+                            ticks: {
+                                callback: function(value) {
+                                    return value + '%';
+                                }
+                            }
+                        }
+                    },
+                    elements: {
+                        point: {
+                            hoverRadius: 6
+                        }
+                    }
+                }
+            });
+        }
+        
+        // Expand parallel arrays ({key: [values]}) back into a list of records
+        function expandRecords(columns) {
+            const keys = Object.keys(columns);
+            const length = keys.length ? columns[keys[0]].length : 0;
+            return Array.from({ length }, (_, i) => {
+                const record = {};
+                keys.forEach(key => { record[key] = columns[key][i]; });
+                return record;
+            });
+        }
+        
+        // Expand the compact wins chart payload into Chart.js datasets
+        function expandChartData(compact) {
+            return {
+                labels: compact.labels,
+                datasets: compact.owners.map((owner, i) => {
+                    const color = compact.palette[compact.colors[i]];
+                    return Object.assign({
+                        label: owner,
+                        data: compact.wins[i],
+                        borderColor: color,
+                        backgroundColor: color + compact.fillAlpha,
+                        hidden: compact.hidden[i] === 1,
+                        // Filled points for playoff seasons, hollow ('1') otherwise
+                        pointBackgroundColor: Array.from(compact.hollow[i], hollow => hollow === '1' ? '#ffffff' : color),
+                        pointBorderColor: compact.wins[i].map(() => color)
+                    }, compact.style);
+                }),
+                downsampled: compact.downsampled === 1
+            };
+        }
+        
+        // Expand the compact boxplot payload, deriving each point's x, win% and record
+        function expandBoxplotData(compact) {
+            const rankIndex = new Map(compact.ranks.map((rank, index) => [rank, index]));
+            const points = compact.beeswarm;
+            return {
+                labels: compact.labels,
+                data: compact.data,
+                beeswarm: points.rank.map((rank, i) => {
+                    const wins = points.wins[i], losses = points.losses[i], ties = points.ties[i];
+                    const totalGames = wins + losses + ties;
+                    return {
+                        x: rankIndex.get(rank),
+                        y: totalGames > 0 ? wins / totalGames : 0,
+                        team: compact.teams[points.team[i]],
+                        owner: compact.owners[points.owner[i]],
+                        year: points.year[i],
+                        record: ties > 0 ? `${wins}-${losses}-${ties}` : `${wins}-${losses}`,
+                        rank: rank
+                    };
+                })
+            };
+        }
+        
+        const payloadExpanders = {
+            chart_data: expandChartData,
+            boxplot_data: expandBoxplotData,
+            cumulative_playoff_data: expandRecords,
+            playoff_slider: table => table,
+            career_table: table => table,
+            season_table: table => table
+        };
+        
+        // Fetch a payload, or use it directly when it is embedded in the page
+        function loadPayload(name) {
+            const payload = reportPayloads[name];
+            if (typeof payload !== 'string') {
+                return Promise.resolve(payloadExpanders[name](payload));
+            }
+            return fetch(payload).then(response => {
+                if (!response.ok) {
+                    throw new Error(`${payload}: ${response.status}`);
+                }
+                return response.json();
+            }).then(payloadExpanders[name]);
+        }
+        
+        // Build a chart straight away when its payloads are embedded, otherwise once
+        // one of its elements comes close to the viewport
+        function initWhenVisible(elementIds, payloadNames, init) {
+            if (payloadNames.every(name => typeof reportPayloads[name] !== 'string')) {
+                init(...payloadNames.map(name => payloadExpanders[name](reportPayloads[name])));
+                return;
+            }
+            
+            const load = () => Promise.all(payloadNames.map(loadPayload))
+                .then(payloads => init(...payloads))
+                .catch(error => console.error('Could not load chart data', error));
+            if (!('IntersectionObserver' in window)) {
+                load();
+                return;
+            }
+            
+            const observer = new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting)) {
+                    observer.disconnect();
+                    load();
+                }
+            }, { rootMargin: '200px' });
+            elementIds.forEach(id => observer.observe(document.getElementById(id)));
+        }
+        
+        initWhenVisible(['careerTable'], ['career_table'], initCareerTable);
+        initWhenVisible(['seasonTable'], ['season_table'], initSeasonTable);
+        // Chart.js is loaded with defer, so it is only defined once the document is parsed
+        function whenChartsReady(start) {
+            if (document.readyState === 'loading') {
+                document.addEventListener('DOMContentLoaded', start);
+            } else {
+                start();
+            }
+        }
+        
+        whenChartsReady(() => {
+            initWhenVisible(['winsChart'], ['chart_data'], initWinsChart);
+            initWhenVisible(['boxplotChart'], ['boxplot_data'], initBoxplotChart);
+            initWhenVisible(['winPctSlider'], ['playoff_slider'], initPlayoffCalculator);
+            initWhenVisible(['cumulativePlayoffChart'], ['cumulative_playoff_data'], initCumulativePlayoffChart);
+        });
+    
\ No newline at end of file
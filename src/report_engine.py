@@ -0,0 +1,935 @@
+"""
+Shared report engine for the league HTML summary reports
+
+Everything except the league name, emoji and file paths is identical between
+the basketball and football reports, so both render from one template
+(report_template.html) with a shared stylesheet (report.css) and script
+(report.js). The template is compiled once per process into a sequence of
+(literal text, placeholder) pairs, so rendering another league costs only the
+data substitution.
+
+By default the stylesheet and script are inlined into every page. With
+external assets they are written once as content-hashed report.<hash>.css and
+report.<hash>.js files that all league pages reference, so browsers can cache
+them long-term; each page then only inlines its own data declarations.
+
+The chart and table data (payloads) is sent in a compact columnar format that
+report.js expands on the client, and is embedded in the page by default. The
+career and season tables are drawn from their columns by report.js, which sorts
+on precomputed keys and only renders the rows in view. With lazy data
+each payload is written as a compact JSON file next to the page instead
+(optionally with a gzip-precompressed copy for servers that serve those), and
+the page fetches it only when its chart scrolls into view. Fetching needs the
+pages to be served over HTTP rather than opened from disk.
+
+Chart.js is pinned to CHARTJS_VERSION and self-hosted: once vendor_chartjs.py
+has saved the build under vendor/ (the Pages deploy runs it before generating
+the reports), a content-hashed copy is written next to the pages (or into the
+shared assets directory) and loaded with defer, checked against its
+subresource-integrity hash. Browsers refuse integrity-checked scripts on pages
+opened from disk, so pages meant for that are rendered with integrity=False
+(--no-integrity). Without a vendored build the pages load the same pinned
+version from the CDN, checked against CHARTJS_INTEGRITY once that is filled in.
+"""
+
+import base64
+import csv
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from logs import log_summary, setup_logging
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_PATH = Path(__file__).parent / 'report_template.html'
+CSS_PATH = Path(__file__).parent / 'report.css'
+JS_PATH = Path(__file__).parent / 'report.js'
+CHARTJS_VERSION = '4.4.1'
+CHARTJS_PATH = Path(__file__).parent / 'vendor' / f'chart-{CHARTJS_VERSION}.umd.js'
+CHARTJS_CDN_URL = f'https://cdn.jsdelivr.net/npm/chart.js@{CHARTJS_VERSION}/dist/chart.umd.js'
+# sha384 of the file at CHARTJS_CDN_URL, as printed by vendor_chartjs.py. Fill it
+# in from a run with network access; it pins the CDN fallback and the download.
+CHARTJS_INTEGRITY = None
+CHARTJS_CDN_TAG = (f'<script defer src="{CHARTJS_CDN_URL}" integrity="{CHARTJS_INTEGRITY}" crossorigin="anonymous"></script>'
+                   if CHARTJS_INTEGRITY else f'<script defer src="{CHARTJS_CDN_URL}"></script>')
+# Points the wins chart draws across all owners (owners x seasons played) before
+# its series are downsampled; 16 owners over 20 seasons already go past it
+CHART_MAX_POINTS = 300
+CHART_MIN_SERIES_POINTS = 12  # no owner's series is cut below this many seasons
+SLIDER_RESOLUTION = 10  # playoff calculator slider positions per percentage point (0.1% steps)
+PLACEHOLDER_PATTERN = re.compile(r'\{\{ (\w+) \}\}')
+# Lines in report.js that declare per-league data, e.g. "const reportPayloads = {{ report_payloads }};"
+DATA_DECLARATION_PATTERN = re.compile(r'^ *const \w+ = \{\{ \w+ \}\};\n', re.M)
+
+OWNER_ROW_TEMPLATE = """
+                <tr>
+                    <td class="rank">#{{ rank }}</td>
+                    <td class="owner-name">{{ owner }}</td>
+                    <td>{{ seasons_played }}</td>
+                    <td class="record">{{ wins }}-{{ losses }}-{{ ties }}</td>
+                    <td><span class="win-pct {{ win_pct_class }}">{{ win_pct }}</span></td>
+                    <td>{{ average_rank }}</td>
+                    <td>{{ championships }}</td>
+                    <td>{{ finals }}</td>
+                    <td>{{ playoffs }}</td>
+                    <td>{{ total_games }}</td>
+                </tr>"""
+
+class ReportAssets(NamedTuple):
+    """The report stylesheet and script, split for inline and external use"""
+    css: str
+    script: tuple          # compiled report.js, data declarations included
+    data_script: tuple     # compiled data declarations only
+    shared_script: str     # report.js without the data declarations
+
+class ReportConfig(NamedTuple):
+    """Everything that differs between the league reports"""
+    league_name: str
+    emoji: str
+    overall_csv: Path
+    detailed_csv: Path
+    output_path: Path
+
+def prepare_overall_standings(rows):
+    """Convert numeric fields of overall standings rows (CSV or in-memory)"""
+    standings = []
+    for row in rows:
+        row = dict(row)
+        # Convert numeric fields
+        row['Seasons_Played'] = int(row['Seasons_Played'])
+        row['Total_Games'] = int(row['Total_Games'])
+        row['Total_Wins'] = int(row['Total_Wins'])
+        row['Total_Losses'] = int(row['Total_Losses'])
+        row['Total_Ties'] = int(row['Total_Ties'])
+        row['Win_Percentage'] = float(row['Win_Percentage'])
+        row['Average_Rank'] = float(row['Average_Rank'])
+        row['Championships'] = int(row['Championships'])
+        row['Finals'] = int(row['Finals'])
+        row['Playoffs'] = int(row['Playoffs'])
+        standings.append(row)
+
+    return standings
+
+def prepare_detailed_standings(rows):
+    """Convert numeric fields of detailed standings rows (CSV or in-memory)"""
+    standings = []
+    for row in rows:
+        row = dict(row)
+        # Convert numeric fields
+        row['Year'] = int(row['Year'])
+        row['Rank'] = int(row['Rank'])
+        row['Wins'] = int(row['Wins'])
+        row['Losses'] = int(row['Losses'])
+        row['Ties'] = int(row['Ties'])
+        standings.append(row)
+
+    return standings
+
+def read_overall_standings(csv_path):
+    """Read the overall standings CSV file"""
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        return prepare_overall_standings(csv.DictReader(f))
+
+def read_detailed_standings(csv_path):
+    """Read the detailed standings CSV file for chart data"""
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        return prepare_detailed_standings(csv.DictReader(f))
+
+def prepare_chart_data(detailed_standings):
+    """Prepare data for the wins vs year chart"""
+    # Group data by owner
+    owners_data = {}
+    all_years = set()
+    
+    for record in detailed_standings:
+        owner = record['Owner']
+        year = record['Year']
+        wins = record['Wins']
+        rank = record['Rank']
+        
+        all_years.add(year)
+        
+        if owner not in owners_data:
+            owners_data[owner] = {}
+        
+        owners_data[owner][year] = {'wins': wins, 'rank': rank}
+    
+    # Sort years
+    sorted_years = sorted(all_years)
+    
+    # Create chart datasets
+    chart_data = {
+        'labels': sorted_years,
+        'datasets': []
+    }
+    
+    # Color palette for lines
+    colors = [
+        '#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6',
+        '#1abc9c', '#34495e', '#e67e22', '#95a5a6', '#f1c40f',
+        '#16a085', '#2980b9', '#8e44ad', '#27ae60', '#d35400',
+        '#7f8c8d'
+    ]
+    
+    color_index = 0
+    for owner, year_data in owners_data.items():
+        # Create data points for this owner
+        data_points = []
+        point_colors = []
+        point_border_colors = []
+        seasons_played = 0
+        
+        base_color = colors[color_index % len(colors)]
+        
+        for year in sorted_years:
+            season_data = year_data.get(year, None)  # None if owner didn't play that year
+            if season_data is not None:
+                seasons_played += 1
+                wins = season_data['wins']
+                rank = season_data['rank']
+                data_points.append(wins)
+                # Filled circles for playoffs (rank <= 4), white circles for non-playoffs
+                if rank <= 4:
+                    point_colors.append(base_color)  # Filled with line color
+                else:
+                    point_colors.append('#ffffff')  # White/hollow
+                point_border_colors.append(base_color)  # Border always matches line color
+            else:
+                data_points.append(None)
+                point_colors.append(base_color)
+                point_border_colors.append(base_color)
+        
+        # Only show by default if owner has 5+ seasons
+        is_visible = seasons_played >= 5
+        
+        chart_data['datasets'].append({
+            'label': owner,
+            'data': data_points,
+            'borderColor': base_color,
+            'backgroundColor': base_color + '20',  # 20% opacity for line area
+            'tension': 0.1,
+            'spanGaps': True,  # Connect points even if there are null values
+            'hidden': not is_visible,  # Hide owners with < 5 seasons by default
+            'pointBackgroundColor': point_colors,
+            'pointBorderColor': point_border_colors,
+            'pointRadius': 6,
+            'pointHoverRadius': 8,
+            'pointBorderWidth': 2
+        })
+        
+        color_index += 1
+    
+    return chart_data
+
+def lttb_indices(xs, ys, threshold):
+    """Pick threshold points of a series with Largest-Triangle-Three-Buckets, returning their indices
+
+    The first and last points are always kept; every bucket in between keeps the
+    point forming the largest triangle with the previously kept point and the
+    average of the next bucket.
+    """
+    count = len(xs)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    bucket_size = (count - 2) / (threshold - 2)
+    kept = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        avg_x = sum(xs[end:next_end]) / (next_end - end)
+        avg_y = sum(ys[end:next_end]) / (next_end - end)
+
+        best_area = -1
+        best_index = start
+        for index in range(start, end):
+            area = abs((xs[previous] - avg_x) * (ys[index] - ys[previous]) -
+                       (xs[previous] - xs[index]) * (avg_y - ys[previous]))
+            if area > best_area:
+                best_area = area
+                best_index = index
+        kept.append(best_index)
+        previous = best_index
+
+    kept.append(count - 1)
+    return kept
+
+def downsample_chart_data(chart_data, max_points=CHART_MAX_POINTS, min_series_points=CHART_MIN_SERIES_POINTS):
+    """Downsample the wins series with LTTB once the chart would draw more than max_points points
+
+    The budget is shared evenly between the owners (but never below
+    min_series_points each), and only series longer than their share are cut.
+    Seasons that are dropped become gaps, which the chart spans, so every series
+    stays aligned with the shared year labels. Smaller charts are returned as is.
+    """
+    played = [[index for index, wins in enumerate(dataset['data']) if wins is not None]
+              for dataset in chart_data['datasets']]
+    if sum(len(indices) for indices in played) <= max_points:
+        return chart_data
+
+    per_series = max(min_series_points, max_points // len(played))
+    if all(len(indices) <= per_series for indices in played):
+        return chart_data
+
+    datasets = []
+    for dataset, indices in zip(chart_data['datasets'], played):
+        if len(indices) <= per_series:
+            datasets.append(dataset)
+            continue
+        kept = {indices[index] for index in lttb_indices(
+            indices, [dataset['data'][index] for index in indices], per_series)}
+        datasets.append(dict(dataset, data=[
+            wins if index in kept else None for index, wins in enumerate(dataset['data'])
+        ]))
+
+    return {'labels': chart_data['labels'], 'datasets': datasets, 'downsampled': True}
+
+def quantile(sorted_values, q):
+    """Return the q-th quantile of sorted values using linear interpolation"""
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def prepare_boxplot_data(detailed_standings, quartiles=False):
+    """Prepare data for the winning percentage by rank boxplot with beeswarm overlay
+
+    With quartiles=True every rank also gets min, q1, median, q3 and max.
+    """
+    # Group data by rank and build the beeswarm points in the same pass
+    rank_data = {}
+    beeswarm_with_coords = []
+    
+    for record in detailed_standings:
+        rank = record['Rank']
+        wins = record['Wins']
+        losses = record['Losses']
+        ties = record['Ties']
+        
+        # Calculate winning percentage
+        total_games = wins + losses + ties
+        if total_games > 0:
+            win_pct = wins / total_games
+        else:
+            win_pct = 0
+        
+        if rank not in rank_data:
+            rank_data[rank] = []
+        rank_data[rank].append(win_pct)
+        
+        # Store individual point data for beeswarm; x is filled in once all ranks are known
+        beeswarm_with_coords.append({
+            'x': None,
+            'y': win_pct,
+            'team': record['Team'],
+            'owner': record['Owner'],
+            'year': record['Year'],
+            'record': f"{wins}-{losses}-{ties}" if ties > 0 else f"{wins}-{losses}",
+            'rank': rank
+        })
+    
+    # Convert to boxplot format
+    boxplot_data = []
+    labels = []
+    ranks = sorted(rank_data.keys())
+    rank_index = {rank: index for index, rank in enumerate(ranks)}
+    
+    # Sort ranks and prepare data
+    for rank in ranks:
+        values = sorted(rank_data[rank])
+        # Calculate mean winning percentage
+        rank_stats = {
+            'mean': sum(values) / len(values),
+            'count': len(values)
+        }
+        if quartiles:
+            rank_stats.update({
+                'min': values[0],
+                'q1': quantile(values, 0.25),
+                'median': quantile(values, 0.5),
+                'q3': quantile(values, 0.75),
+                'max': values[-1]
+            })
+        
+        boxplot_data.append(rank_stats)
+        labels.append(f"Rank {rank}")
+    
+    # Place beeswarm points in vertical lines, one per rank
+    for point in beeswarm_with_coords:
+        point['x'] = rank_index[point['rank']]
+    
+    return {
+        'labels': labels,
+        'data': boxplot_data,
+        'beeswarm': beeswarm_with_coords
+    }
+
+def calculate_additional_stats(standings):
+    """Calculate additional statistics for the report"""
+    total_seasons = sum(owner['Seasons_Played'] for owner in standings)
+    total_games = sum(owner['Total_Games'] for owner in standings)
+    total_owners = len(standings)
+    
+    # Find best/worst records
+    best_win_pct = max(standings, key=lambda x: x['Win_Percentage'])
+    worst_win_pct = min(standings, key=lambda x: x['Win_Percentage'])
+    most_wins = max(standings, key=lambda x: x['Total_Wins'])
+    most_losses = max(standings, key=lambda x: x['Total_Losses'])
+    most_seasons = max(standings, key=lambda x: x['Seasons_Played'])
+    
+    return {
+        'total_seasons': total_seasons,
+        'total_games': total_games,
+        'total_owners': total_owners,
+        'best_win_pct': best_win_pct,
+        'worst_win_pct': worst_win_pct,
+        'most_wins': most_wins,
+        'most_losses': most_losses,
+        'most_seasons': most_seasons
+    }
+
+def get_win_pct_class(win_pct):
+    """Return CSS class based on win percentage"""
+    if win_pct >= 0.600:
+        return 'excellent'
+    elif win_pct >= 0.550:
+        return 'good'
+    elif win_pct >= 0.500:
+        return 'average'
+    elif win_pct >= 0.450:
+        return 'below-average'
+    else:
+        return 'poor'
+
+def sorted_playoff_records(detailed_standings):
+    """Return sorted win percentages and prefix sums of playoff appearances"""
+    records = []
+    for record in detailed_standings:
+        # Calculate winning percentage
+        total_games = record['Wins'] + record['Losses'] + record['Ties']
+        win_pct = record['Wins'] / total_games if total_games > 0 else 0
+
+        # Determine if made playoffs (rank <= 4)
+        records.append((win_pct, record['Rank'] <= 4))
+    records.sort(key=lambda r: r[0])
+
+    win_pcts = [win_pct for win_pct, _ in records]
+    playoff_prefix = [0]
+    for _, made_playoffs in records:
+        playoff_prefix.append(playoff_prefix[-1] + made_playoffs)
+    return win_pcts, playoff_prefix
+
+def calculate_playoff_slider_table(detailed_standings, resolution=SLIDER_RESOLUTION):
+    """Count playoff teams and all teams with win% >= every slider position
+
+    The slider moves in 1/resolution percent steps, so position i (threshold
+    i / (100 * resolution)) can be looked up directly by the page.
+    """
+    win_pcts, playoff_prefix = sorted_playoff_records(detailed_standings)
+    total_records = len(win_pcts)
+    steps = 100 * resolution
+
+    playoffs = []
+    teams = []
+    for position in range(0, steps + 1):
+        start = bisect_left(win_pcts, position / steps)
+        playoffs.append(playoff_prefix[-1] - playoff_prefix[start])
+        teams.append(total_records - start)
+
+    return {'resolution': resolution, 'playoffs': playoffs, 'teams': teams}
+
+def calculate_cumulative_playoff_percentages(detailed_standings, steps=100):
+    """Calculate cumulative playoff percentage for teams with win% >= threshold"""
+    win_pcts, playoff_prefix = sorted_playoff_records(detailed_standings)
+    total_records = len(win_pcts)
+
+    # Calculate cumulative percentages for different thresholds
+    cumulative_data = []
+
+    # Create thresholds from 0% to 100% (1% increments by default)
+    for threshold in range(0, steps + 1):
+        threshold_pct = threshold / steps
+
+        # Teams with win% >= threshold are the tail of the sorted list
+        start = bisect_left(win_pcts, threshold_pct)
+        qualifying_count = total_records - start
+
+        if qualifying_count > 0:
+            playoff_percentage = (playoff_prefix[-1] - playoff_prefix[start]) / qualifying_count
+        else:
+            playoff_percentage = 0
+
+        cumulative_data.append({
+            'threshold': threshold_pct,
+            'playoff_percentage': playoff_percentage,
+            'total_teams': qualifying_count
+        })
+
+    return cumulative_data
+
+def compile_template(text):
+    """Split a template into (literal, placeholder) pairs; the last pair has no placeholder"""
+    parts = PLACEHOLDER_PATTERN.split(text)
+    return tuple(zip(parts[0::2], parts[1::2] + [None]))
+
+@lru_cache(maxsize=None)
+def load_template(path=TEMPLATE_PATH):
+    """Read and compile a template file, once per process"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return compile_template(f.read())
+
+def render_template(compiled, context):
+    """Yield a compiled template's text with each placeholder replaced by its context value
+
+    A context value is either a string or an iterable of string chunks.
+    """
+    for literal, name in compiled:
+        yield literal
+        if name is not None:
+            value = context[name]
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+OWNER_ROW = compile_template(OWNER_ROW_TEMPLATE)
+
+def iter_owner_rows(standings):
+    """Render one career standings table row per owner"""
+    for i, owner in enumerate(standings, 1):
+        yield ''.join(render_template(OWNER_ROW, {
+            'rank': str(i),
+            'owner': owner['Owner'],
+            'seasons_played': str(owner['Seasons_Played']),
+            'wins': str(owner['Total_Wins']),
+            'losses': str(owner['Total_Losses']),
+            'ties': str(owner['Total_Ties']),
+            'win_pct_class': get_win_pct_class(owner['Win_Percentage']),
+            'win_pct': f"{owner['Win_Percentage']:.3f}",
+            'average_rank': f"{owner['Average_Rank']:.1f}",
+            'championships': str(owner['Championships']),
+            'finals': str(owner['Finals']),
+            'playoffs': str(owner['Playoffs']),
+            'total_games': str(owner['Total_Games'])
+        }))
+
+def prepare_career_table(standings):
+    """Prepare the career standings table as typed columns, one entry per owner"""
+    return {
+        'owner': [owner['Owner'] for owner in standings],
+        'seasons': [owner['Seasons_Played'] for owner in standings],
+        'wins': [owner['Total_Wins'] for owner in standings],
+        'losses': [owner['Total_Losses'] for owner in standings],
+        'ties': [owner['Total_Ties'] for owner in standings],
+        # Rounded as displayed, so the page shows the same figures as the server-rendered rows
+        'win_pct': [round(owner['Win_Percentage'], 3) for owner in standings],
+        'average_rank': [round(owner['Average_Rank'], 1) for owner in standings],
+        'championships': [owner['Championships'] for owner in standings],
+        'finals': [owner['Finals'] for owner in standings],
+        'playoffs': [owner['Playoffs'] for owner in standings],
+        'total_games': [owner['Total_Games'] for owner in standings]
+    }
+
+def prepare_season_table(detailed_standings):
+    """Prepare the season-by-season table as typed columns with dictionary-encoded teams and owners"""
+    teams = {}
+    owners = {}
+    columns = {key: [] for key in ('year', 'team', 'owner', 'rank', 'wins', 'losses', 'ties')}
+    for record in detailed_standings:
+        columns['year'].append(record['Year'])
+        columns['team'].append(teams.setdefault(record['Team'], len(teams)))
+        columns['owner'].append(owners.setdefault(record['Owner'], len(owners)))
+        columns['rank'].append(record['Rank'])
+        columns['wins'].append(record['Wins'])
+        columns['losses'].append(record['Losses'])
+        columns['ties'].append(record['Ties'])
+
+    return {'teams': list(teams), 'owners': list(owners), 'rows': columns}
+
+CHART_STYLE_KEYS = ('tension', 'spanGaps', 'pointRadius', 'pointHoverRadius', 'pointBorderWidth')
+
+def encode_records(records):
+    """Encode a list of same-shaped dicts as parallel arrays"""
+    keys = list(records[0]) if records else []
+    return {key: [record[key] for record in records] for key in keys}
+
+def encode_chart_data(chart_data):
+    """Encode the wins chart datasets compactly: one palette, shared style, per-owner arrays
+
+    Each owner keeps its wins array; its point colours shrink to a string with '1'
+    for hollow (non-playoff) points, since filled points use the line colour.
+    """
+    datasets = chart_data['datasets']
+    palette = []
+    colors = []
+    hollow = []
+    for dataset in datasets:
+        color = dataset['borderColor']
+        if color not in palette:
+            palette.append(color)
+        colors.append(palette.index(color))
+        hollow.append(''.join('0' if point == color else '1' for point in dataset['pointBackgroundColor']))
+
+    return {
+        'labels': chart_data['labels'],
+        'style': {key: datasets[0][key] for key in CHART_STYLE_KEYS} if datasets else {},
+        'fillAlpha': '20',
+        'palette': palette,
+        'owners': [dataset['label'] for dataset in datasets],
+        'colors': colors,
+        'hidden': [int(dataset['hidden']) for dataset in datasets],
+        'wins': [dataset['data'] for dataset in datasets],
+        'hollow': hollow,
+        'downsampled': int(chart_data.get('downsampled', False))
+    }
+
+def encode_boxplot_data(boxplot_data):
+    """Encode the beeswarm points as parallel arrays with dictionary-encoded teams and owners
+
+    x, the win percentage and the record string are derived again by the client.
+    """
+    teams = {}
+    owners = {}
+    ranks = {}
+    columns = {key: [] for key in ('rank', 'year', 'team', 'owner', 'wins', 'losses', 'ties')}
+    for point in boxplot_data['beeswarm']:
+        ranks[point['x']] = point['rank']
+        wins, losses, ties = (point['record'].split('-') + ['0'])[:3]
+        columns['rank'].append(point['rank'])
+        columns['year'].append(point['year'])
+        columns['team'].append(teams.setdefault(point['team'], len(teams)))
+        columns['owner'].append(owners.setdefault(point['owner'], len(owners)))
+        columns['wins'].append(int(wins))
+        columns['losses'].append(int(losses))
+        columns['ties'].append(int(ties))
+
+    return {
+        'labels': boxplot_data['labels'],
+        'data': boxplot_data['data'],
+        'ranks': [ranks[index] for index in sorted(ranks)],
+        'teams': list(teams),
+        'owners': list(owners),
+        'beeswarm': columns
+    }
+
+def encode_payloads(payloads):
+    """Encode every chart payload in its compact wire format"""
+    encoders = {
+        'chart_data': encode_chart_data,
+        'boxplot_data': encode_boxplot_data,
+        'cumulative_playoff_data': encode_records,
+        'playoff_slider': lambda table: table,
+        'career_table': lambda table: table,
+        'season_table': lambda table: table
+    }
+    return {name: encoders[name](payload) for name, payload in payloads.items()}
+
+def iter_embedded_payloads(payloads):
+    """Yield the payloads as one JSON object, one payload per chunk"""
+    separator = ''
+    yield '{'
+    for name, payload in payloads.items():
+        yield f"{separator}{json.dumps(name)}: "
+        yield json.dumps(payload, separators=(',', ':'))
+        separator = ', '
+    yield '}'
+
+def write_payloads(payloads, output_path, precompress=False):
+    """Write each payload as compact JSON into <page>.data/ and return {name: url}
+
+    URLs are relative to the page and carry a content hash so caches pick up new data.
+    """
+    output_path = Path(output_path)
+    data_dir = output_path.with_name(output_path.stem + '.data')
+    data_dir.mkdir(exist_ok=True)
+
+    urls = {}
+    for name, payload in payloads.items():
+        content = json.dumps(payload, separators=(',', ':'))
+        path = data_dir / f"{name}.json"
+        write_report([content], path)
+        if precompress:
+            path.with_name(path.name + '.gz').write_bytes(gzip.compress(content.encode('utf-8'), mtime=0))
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+        urls[name] = f"{data_dir.name}/{path.name}?v={digest}"
+    return urls
+
+def report_context(config, standings, stats, payloads, payload_urls=None):
+    """Build the placeholder values for the report template
+
+    payload_urls is None to embed the payloads, or {name: url} to have the page fetch them.
+    """
+    context = {
+        'league_name': config.league_name,
+        'league_emoji': config.emoji,
+        'timestamp': datetime.datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+        'total_owners': str(stats['total_owners']),
+        'total_seasons': str(stats['total_seasons']),
+        'total_games': f"{stats['total_games']:,}",
+        'veteran_owners': str(len([o for o in standings if o['Seasons_Played'] >= 5])),
+        'owner_rows': iter_owner_rows(standings),
+        'most_wins_owner': stats['most_wins']['Owner'],
+        'most_wins': str(stats['most_wins']['Total_Wins']),
+        'most_wins_seasons': str(stats['most_wins']['Seasons_Played']),
+        'most_losses_owner': stats['most_losses']['Owner'],
+        'most_losses': str(stats['most_losses']['Total_Losses']),
+        'most_losses_seasons': str(stats['most_losses']['Seasons_Played']),
+        'most_seasons_owner': stats['most_seasons']['Owner'],
+        'most_seasons': str(stats['most_seasons']['Seasons_Played']),
+        'average_win_pct': f"{sum(o['Win_Percentage'] for o in standings) / len(standings):.3f}",
+        'owners_above_600': str(len([o for o in standings if o['Win_Percentage'] >= 0.600])),
+        'owners_above_550': str(len([o for o in standings if o['Win_Percentage'] >= 0.550])),
+        'owners_above_500': str(len([o for o in standings if o['Win_Percentage'] >= 0.500])),
+        'owners_below_500': str(len([o for o in standings if o['Win_Percentage'] < 0.500])),
+        'slider_step': f"{1 / SLIDER_RESOLUTION:g}",
+        'report_payloads': iter_embedded_payloads(payloads) if payload_urls is None else json.dumps(payload_urls)
+    }
+    for key in ('best_win_pct', 'worst_win_pct'):
+        owner = stats[key]
+        context[f'{key}_owner'] = owner['Owner']
+        context[key] = f"{owner['Win_Percentage']:.3f}"
+        context[f'{key}_wins'] = str(owner['Total_Wins'])
+        context[f'{key}_losses'] = str(owner['Total_Losses'])
+        context[f'{key}_ties'] = str(owner['Total_Ties'])
+    return context
+
+@lru_cache(maxsize=None)
+def load_assets(css_path=CSS_PATH, js_path=JS_PATH):
+    """Read and compile the report stylesheet and script, once per process"""
+    with open(css_path, 'r', encoding='utf-8') as f:
+        css = f.read()
+    with open(js_path, 'r', encoding='utf-8') as f:
+        script = f.read()
+
+    data_script = ''.join(DATA_DECLARATION_PATTERN.findall(script))
+    return ReportAssets(css, compile_template(script), compile_template(data_script),
+                        DATA_DECLARATION_PATTERN.sub('', script))
+
+def asset_name(content, extension):
+    """Return the content-hashed file name for a shared asset"""
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+    return f"report.{digest}.{extension}"
+
+def write_assets(assets_dir):
+    """Write report.<hash>.css and report.<hash>.js into assets_dir, returning their paths
+
+    A file whose hashed name already exists has identical content and is left alone.
+    """
+    assets = load_assets()
+    assets_dir = Path(assets_dir)
+    paths = []
+    for content, extension in ((assets.css, 'css'), (assets.shared_script, 'js')):
+        path = assets_dir / asset_name(content, extension)
+        if not path.exists():
+            write_report([content], path)
+        paths.append(path)
+    return paths
+
+def asset_urls(assets_dir, output_path):
+    """Write the shared assets and return their (css, js) URLs relative to the report page"""
+    page_dir = Path(output_path).parent
+    return tuple(Path(os.path.relpath(path, page_dir)).as_posix() for path in write_assets(assets_dir))
+
+def subresource_integrity(content):
+    """Return the sha384 subresource-integrity value of a file's bytes"""
+    return 'sha384-' + base64.b64encode(hashlib.sha384(content).digest()).decode('ascii')
+
+@lru_cache(maxsize=None)
+def load_chartjs(path=CHARTJS_PATH):
+    """Read the vendored Chart.js build once per process, or None if it has not been vendored"""
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+def write_chartjs(assets_dir):
+    """Write the content-hashed copy of the vendored Chart.js into assets_dir, returning its path
+
+    Returns None when nothing has been vendored. The copy is written under a
+    temporary name unique to this process, so workers sharing assets_dir never
+    interleave their writes.
+    """
+    content = load_chartjs()
+    if content is None:
+        return None
+
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    path = Path(assets_dir) / f"chart-{CHARTJS_VERSION}.{digest}.js"
+    if not path.exists():
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(content)
+        temp_path.replace(path)
+    return path
+
+def chartjs_tag(assets_dir, output_path, integrity=True):
+    """Write the vendored Chart.js into assets_dir and return the deferred <script> tag loading it
+
+    The tag carries the copy's integrity hash unless integrity is False (for
+    pages opened from disk). Falls back to the pinned CDN build when nothing
+    has been vendored.
+    """
+    path = write_chartjs(assets_dir)
+    if path is None:
+        return CHARTJS_CDN_TAG
+    content = load_chartjs()
+
+    url = Path(os.path.relpath(path, Path(output_path).parent)).as_posix()
+    if integrity:
+        return f'<script defer src="{url}" integrity="{subresource_integrity(content)}"></script>'
+    return f'<script defer src="{url}"></script>'
+
+def iter_assets(context, urls=None):
+    """Return the (styles, scripts) chunks, inlined or referencing the shared asset URLs"""
+    assets = load_assets()
+    if urls is None:
+        styles = f"<style>{assets.css}</style>"
+        scripts = [f"<script>", *render_template(assets.script, context), "</script>"]
+    else:
+        css_url, js_url = urls
+        styles = f'<link rel="stylesheet" href="{css_url}">'
+        scripts = ["<script>\n", *render_template(assets.data_script, context),
+                   f'    </script>\n    <script src="{js_url}"></script>']
+    return styles, scripts
+
+def iter_html_report(config, standings, stats, payloads, urls=None, payload_urls=None, chartjs=CHARTJS_CDN_TAG):
+    """Generate the HTML report as a stream of text chunks
+
+    urls is None to inline the stylesheet and script, or the (css, js) URLs of the shared assets.
+    """
+    context = report_context(config, standings, stats, payloads, payload_urls)
+    context['styles'], context['scripts'] = iter_assets(context, urls)
+    context['chartjs'] = chartjs
+    return render_template(load_template(), context)
+
+def build_report(config, standings, detailed_standings, urls=None, lazy_data=False, precompress=False, assets_dir=None,
+                 integrity=True):
+    """Compute every chart dataset and render the report lazily, returning (html_chunks, stats)
+
+    With lazy_data the chart payloads are written next to the page and fetched on demand.
+    The vendored Chart.js is copied into assets_dir, by default the page's directory,
+    and loaded with its integrity hash unless integrity is False.
+    """
+    # Prepare chart data
+    chart_data = downsample_chart_data(prepare_chart_data(detailed_standings))
+    logger.debug(f"Prepared chart data for {len(chart_data['datasets'])} owners")
+
+    # Prepare boxplot data
+    boxplot_data = prepare_boxplot_data(detailed_standings)
+    logger.debug(f"Prepared boxplot data for {len(boxplot_data['labels'])} ranks")
+
+    # Calculate cumulative playoff percentages
+    cumulative_playoff_data = calculate_cumulative_playoff_percentages(detailed_standings)
+    logger.debug(f"Calculated cumulative playoff data for {len(cumulative_playoff_data)} thresholds")
+
+    # Build the playoff calculator's slider lookup table
+    playoff_slider = calculate_playoff_slider_table(detailed_standings)
+
+    # Build the sortable career and season tables
+    career_table = prepare_career_table(standings)
+    season_table = prepare_season_table(detailed_standings)
+
+    # Calculate statistics
+    stats = calculate_additional_stats(standings)
+
+    payloads = encode_payloads({
+        'chart_data': chart_data,
+        'boxplot_data': boxplot_data,
+        'cumulative_playoff_data': cumulative_playoff_data,
+        'playoff_slider': playoff_slider,
+        'career_table': career_table,
+        'season_table': season_table
+    })
+    payload_urls = write_payloads(payloads, config.output_path, precompress) if lazy_data else None
+
+    # Self-host Chart.js; integrity hashes only work for pages served over HTTP
+    chartjs = chartjs_tag(Path(config.output_path).parent if assets_dir is None else assets_dir,
+                          config.output_path, integrity)
+
+    # Generate HTML
+    html_chunks = iter_html_report(config, standings, stats, payloads, urls, payload_urls, chartjs)
+    return html_chunks, stats
+
+def report_summary(config, stats):
+    """Return the summary counts of a generated report"""
+    return {
+        'output': str(config.output_path),
+        'owners': stats['total_owners'],
+        'seasons': stats['total_seasons'],
+        'best_performer': stats['best_win_pct']['Owner'],
+        'best_win_pct': stats['best_win_pct']['Win_Percentage']
+    }
+
+def write_report(html_chunks, output_path):
+    """Stream the rendered report to disk, replacing the old file only once it is complete"""
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        for chunk in html_chunks:
+            f.write(chunk)
+    temp_path.replace(output_path)
+
+def render_league(config, assets_dir=None, lazy_data=False, precompress=False, integrity=True):
+    """Read one league's CSVs and write its report, returning (owner count, seconds)
+
+    With assets_dir set, the page references shared assets written there instead of inlining them.
+    """
+    start = time.perf_counter()
+    standings = read_overall_standings(config.overall_csv)
+    detailed_standings = read_detailed_standings(config.detailed_csv)
+    urls = asset_urls(assets_dir, config.output_path) if assets_dir is not None else None
+    html_chunks, _ = build_report(config, standings, detailed_standings, urls=urls, lazy_data=lazy_data,
+                                  precompress=precompress, assets_dir=assets_dir, integrity=integrity)
+    write_report(html_chunks, config.output_path)
+    return len(standings), time.perf_counter() - start
+
+def main(config, args=()):
+    """Generate the report for one league
+
+    --external-assets writes shared assets next to the page, --lazy-data writes the chart
+    payloads to <page>.data/ for on-demand loading and --gzip also precompresses them.
+    --no-integrity leaves the integrity hash off the Chart.js tag, for pages opened from disk.
+    --verbose, --quiet and --log-json choose the logging output (see logs.py).
+    """
+    setup_logging(args)
+    logger.info(f"Generating Fantasy {config.league_name} League Overall Standings Report...")
+    
+    try:
+        # Read data
+        standings = read_overall_standings(config.overall_csv)
+        logger.info(f"Loaded standings for {len(standings)} owners")
+        
+        # Read detailed data for chart
+        detailed_standings = read_detailed_standings(config.detailed_csv)
+        logger.info(f"Loaded detailed data: {len(detailed_standings)} records")
+        
+        output_path = config.output_path
+        urls = asset_urls(output_path.parent, output_path) if '--external-assets' in args else None
+        html_chunks, stats = build_report(config, standings, detailed_standings, urls=urls,
+                                          lazy_data='--lazy-data' in args, precompress='--gzip' in args,
+                                          integrity='--no-integrity' not in args)
+        
+        # Stream to file
+        write_report(html_chunks, output_path)
+        
+        logger.info(f"✅ Report generated successfully: {output_path}")
+        logger.info(f"📊 Report includes {len(standings)} owners across {stats['total_seasons']} total seasons")
+        logger.info(f"🏆 Best performer: {stats['best_win_pct']['Owner']} ({stats['best_win_pct']['Win_Percentage']:.3f})")
+        log_summary(logger, 'report', report_summary(config, stats))
+        
+    except FileNotFoundError:
+        logger.error("❌ Error: ownersStandingsOverall.csv not found")
+        logger.error("Please run the data pipeline first: python3 data_pipeline.py")
+    except Exception as e:
+        logger.error(f"❌ Error generating report: {e}")
@@ -0,0 +1,534 @@
+"""
+Parse ESPN league history standings pages into Year/Team/Rank/Wins/Losses/Ties rows
+
+This is the shared engine behind rawStandings.py (basketball) and fbStandings.py
+(football). It can be imported and called in-process:
+
+    from standings_parser import parse_standings
+    for row in parse_standings('../raw/gm_standings.html'):
+        print(row.Year, row.Team, row.Wins)
+
+Engines:
+  stream     - read the page in chunks and extract one season-container at a
+               time (lxml's HTMLPullParser when installed, otherwise htmlparser)
+  htmlparser - standard library event-driven parser
+  lxml       - lxml's incremental HTML parser
+  soup       - build a full BeautifulSoup tree and search it (original parser)
+
+Historic seasons never change, so parsed seasons can be kept in a SeasonCache
+keyed by year and a hash of the season-container markup. With a cache, the
+page is only split into season blocks and hashed; just the new or modified
+blocks go through an engine.
+"""
+
+import re
+import csv
+import hashlib
+import io
+import json
+import logging
+from contextlib import nullcontext
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import NamedTuple
+
+from logs import log_summary
+from normalizer import NORMALIZER_VERSION, clean_team_name
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+SEASON_CACHE_VERSION = 2
+
+SEASON_START_PATTERN = re.compile(r'<div\b[^>]*\bclass="[^"]*\bseason-container\b[^"]*"[^>]*>')
+YEAR_TEXT_PATTERN = re.compile(r'\byear-text\b[^>]*>([^<]*)<')
+RECORD_PATTERN = re.compile(r'(\d+)-(\d+)-(\d+)')
+
+class StandingRow(NamedTuple):
+    """One team's final standing for one season"""
+    Year: str
+    Team: str
+    Rank: int
+    Wins: int
+    Losses: int
+    Ties: int
+
+FIELDNAMES = list(StandingRow._fields)
+
+def build_standing(year, rank_text, team_title, record_text):
+    """Build a StandingRow from the raw cell values, or None if the row is invalid"""
+    try:
+        rank = int(rank_text.strip())
+    except (ValueError, TypeError):
+        return None  # Skip if rank is not a valid number
+
+    if team_title is None:
+        return None
+
+    # Clean special characters from team name
+    team_name = clean_team_name(team_title.strip())
+
+    # Parse record using regex to handle format like "11-8-0"
+    record_match = RECORD_PATTERN.match(record_text.strip())
+    if not record_match:
+        return None
+
+    return StandingRow(
+        year,
+        team_name,
+        rank,
+        int(record_match.group(1)),
+        int(record_match.group(2)),
+        int(record_match.group(3))
+    )
+
+def _open_source(source):
+    """Open a path for reading, or pass an already open file object through"""
+    if hasattr(source, 'read'):
+        return nullcontext(source)
+    return open(source, 'r', encoding='utf-8')
+
+def _iter_chunks(source, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield the source text in fixed-size chunks"""
+    with _open_source(source) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def iter_seasons_soup(source):
+    """Yield (year, rows) for each season using a full BeautifulSoup tree"""
+    from bs4 import BeautifulSoup
+
+    # Read the HTML file
+    with _open_source(source) as f:
+        html_content = f.read()
+
+    # Parse HTML
+    soup = BeautifulSoup(html_content, 'html.parser')
+
+    # Find all year sections
+    for section in soup.find_all('div', class_='season-container'):
+        # Extract year
+        year_header = section.find('span', class_='year-text')
+        if not year_header:
+            continue
+
+        year = year_header.text.strip()
+
+        # Find the standings table in this section
+        table = section.find('table', class_='Table')
+        if not table:
+            continue
+
+        rows = []
+        for row in table.find('tbody').find_all('tr'):
+            cells = row.find_all('td')
+            if len(cells) < 3:
+                continue
+
+            team_span = cells[1].find('span', {'title': True})
+            standing = build_standing(
+                year,
+                cells[0].get_text(),
+                team_span.get('title') if team_span else None,
+                cells[2].get_text()
+            )
+            if standing:
+                rows.append(standing)
+
+        yield year, rows
+
+class SeasonStreamParser(HTMLParser):
+    """Event-driven parser that collects each season-container as soon as it closes"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.completed = []  # (year, rows) for seasons closed since the last drain
+        self._season_depth = 0  # open divs inside the current season-container
+        self._start_season()
+
+    def _start_season(self):
+        self._year = None
+        self._year_parts = None
+        self._span_depth = 0
+        self._table_state = 'before'  # before -> table -> tbody -> done
+        self._table_depth = 0
+        self._rows = []
+        self._cells = None
+        self._open_cells = []
+
+    def handle_starttag(self, tag, attrs):
+        if self._season_depth == 0:
+            if tag == 'div' and 'season-container' in _class_tokens(attrs):
+                self._season_depth = 1
+                self._start_season()
+            return
+
+        if tag == 'div':
+            self._season_depth += 1
+        elif tag == 'span':
+            if self._year_parts is not None:
+                self._span_depth += 1
+            elif self._year is None and 'year-text' in _class_tokens(attrs):
+                self._year_parts = []
+                self._span_depth = 1
+            elif self._open_cells:
+                # Remember the first titled span inside each open cell
+                title = dict(attrs).get('title')
+                if title is not None:
+                    for cell in self._open_cells:
+                        if cell['title'] is None:
+                            cell['title'] = title
+
+        if tag == 'table':
+            if self._table_state == 'before' and 'Table' in _class_tokens(attrs):
+                self._table_state = 'table'
+                self._table_depth = 1
+            elif self._table_state in ('table', 'tbody'):
+                self._table_depth += 1
+        elif tag == 'tbody' and self._table_state == 'table':
+            self._table_state = 'tbody'
+        elif tag == 'tr' and self._table_state == 'tbody':
+            self._cells = []
+            self._open_cells = []
+        elif tag == 'td' and self._cells is not None:
+            cell = {'text': [], 'title': None}
+            self._cells.append(cell)
+            self._open_cells.append(cell)
+
+    def handle_endtag(self, tag):
+        if self._season_depth == 0:
+            return
+
+        if tag == 'div':
+            self._season_depth -= 1
+            if self._season_depth == 0:
+                self._finish_season()
+        elif tag == 'span' and self._year_parts is not None:
+            self._span_depth -= 1
+            if self._span_depth == 0:
+                self._year = ''.join(self._year_parts).strip()
+                self._year_parts = None
+        elif tag == 'td' and self._open_cells:
+            self._open_cells.pop()
+        elif tag == 'tr' and self._cells is not None:
+            self._finish_row()
+        elif tag == 'tbody' and self._table_state == 'tbody':
+            self._table_state = 'done'
+        elif tag == 'table' and self._table_state in ('table', 'tbody'):
+            self._table_depth -= 1
+            if self._table_depth == 0:
+                self._table_state = 'done'
+
+    def handle_data(self, data):
+        if self._year_parts is not None:
+            self._year_parts.append(data)
+        for cell in self._open_cells:
+            cell['text'].append(data)
+
+    def _finish_row(self):
+        cells = self._cells
+        self._cells = None
+        self._open_cells = []
+        if len(cells) < 3:
+            return
+
+        standing = build_standing(
+            self._year,
+            ''.join(cells[0]['text']),
+            cells[1]['title'],
+            ''.join(cells[2]['text'])
+        )
+        if standing:
+            self._rows.append(standing)
+
+    def _finish_season(self):
+        # Seasons without a year header or standings table are skipped
+        if self._year is not None and self._table_state != 'before':
+            self.completed.append((self._year, self._rows))
+        self._start_season()
+
+def _class_tokens(attrs):
+    """Return the class names from an HTMLParser attribute list"""
+    for name, value in attrs:
+        if name == 'class' and value:
+            return value.split()
+    return []
+
+def iter_seasons_htmlparser(source):
+    """Yield (year, rows) for each season while reading the source in chunks"""
+    parser = SeasonStreamParser()
+    for chunk in _iter_chunks(source):
+        parser.feed(chunk)
+        yield from parser.completed
+        parser.completed = []
+    parser.close()
+    yield from parser.completed
+
+def iter_seasons_lxml(source):
+    """Yield (year, rows) for each season using lxml's incremental HTML parser"""
+    from lxml import etree
+
+    parser = etree.HTMLPullParser(events=('end',), tag='div')
+    for chunk in _iter_chunks(source):
+        parser.feed(chunk)
+        yield from _drain_lxml_seasons(parser)
+    parser.close()
+    yield from _drain_lxml_seasons(parser)
+
+def _drain_lxml_seasons(parser):
+    """Extract and free every season-container the pull parser has finished"""
+    for _, element in parser.read_events():
+        if 'season-container' not in (element.get('class') or '').split():
+            continue
+
+        season = _extract_lxml_season(element)
+
+        # Free the finished season and anything parsed before it
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+
+        if season:
+            yield season
+
+def _extract_lxml_season(section):
+    """Extract (year, rows) from a parsed season-container element"""
+    year_header = _find_with_class(section, 'span', 'year-text')
+    if year_header is None:
+        return None
+
+    year = ''.join(year_header.itertext()).strip()
+
+    table = _find_with_class(section, 'table', 'Table')
+    if table is None:
+        return None
+
+    rows = []
+    tbody = next(table.iter('tbody'), None)
+    for row in (tbody.iter('tr') if tbody is not None else []):
+        cells = list(row.iter('td'))
+        if len(cells) < 3:
+            continue
+
+        team_span = next((span for span in cells[1].iter('span') if span.get('title') is not None), None)
+        standing = build_standing(
+            year,
+            ''.join(cells[0].itertext()),
+            team_span.get('title') if team_span is not None else None,
+            ''.join(cells[2].itertext())
+        )
+        if standing:
+            rows.append(standing)
+
+    return year, rows
+
+def _find_with_class(element, tag, class_name):
+    """Return the first descendant with the given tag and class, or None"""
+    for candidate in element.iter(tag):
+        if class_name in (candidate.get('class') or '').split():
+            return candidate
+    return None
+
+def iter_seasons_stream(source):
+    """Yield (year, rows) incrementally, preferring lxml when it is installed"""
+    try:
+        import lxml.etree  # noqa: F401
+    except ImportError:
+        return iter_seasons_htmlparser(source)
+    return iter_seasons_lxml(source)
+
+ENGINES = {
+    'stream': iter_seasons_stream,
+    'htmlparser': iter_seasons_htmlparser,
+    'lxml': iter_seasons_lxml,
+    'soup': iter_seasons_soup
+}
+
+class SeasonCache:
+    """Parsed seasons keyed by year and the sha256 of their season-container markup
+
+    The cache file also records the normalizer version and is ignored once team
+    names are cleaned differently. With refresh, the existing file is not read,
+    so every season is parsed again and the file is rewritten from scratch.
+    """
+
+    def __init__(self, path=None, refresh=False):
+        self.path = path
+        self.entries = {}
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+        if path and not refresh:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (FileNotFoundError, ValueError):
+                data = {}
+            if data.get('version') == SEASON_CACHE_VERSION and data.get('normalizer') == NORMALIZER_VERSION:
+                self.entries = data.get('seasons', {})
+
+    def get(self, key):
+        """Return (found, season) where season is (year, rows) or None for a skipped block"""
+        if key not in self.entries:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self.used.add(key)
+        entry = self.entries[key]
+        if entry is None:
+            return True, None
+        return True, (entry['year'], [StandingRow(*row) for row in entry['rows']])
+
+    def put(self, key, season):
+        """Store a freshly parsed season (or None if the block held no season)"""
+        self.used.add(key)
+        if season is None:
+            self.entries[key] = None
+        else:
+            year, rows = season
+            self.entries[key] = {'year': year, 'rows': [list(row) for row in rows]}
+
+    def save(self):
+        """Write the seasons seen in this run back to disk, dropping stale ones"""
+        if not self.path:
+            return
+        seasons = {key: self.entries[key] for key in sorted(self.used)}
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'version': SEASON_CACHE_VERSION, 'normalizer': NORMALIZER_VERSION, 'seasons': seasons}, f)
+
+def iter_season_blocks(source):
+    """Yield the raw markup of each season-container, reading the source in chunks
+
+    A block runs from one season-container opening tag to the next, so the last
+    block also carries the closing markup of the page. Only the opening tags are
+    located; nothing is parsed.
+    """
+    buffer = ''
+    block_start = None
+    search_from = 0
+    for chunk in _iter_chunks(source):
+        buffer += chunk
+        while True:
+            match = SEASON_START_PATTERN.search(buffer, search_from)
+            if not match:
+                # An opening tag may straddle the chunk boundary
+                search_from = max(search_from, len(buffer) - 512)
+                break
+            if block_start is not None:
+                yield buffer[block_start:match.start()]
+            block_start = match.start()
+            search_from = match.end()
+
+        # Drop everything before the current block
+        trim = block_start if block_start is not None else search_from
+        buffer = buffer[trim:]
+        search_from -= trim
+        if block_start is not None:
+            block_start = 0
+
+    if block_start is not None:
+        yield buffer[block_start:]
+
+def season_block_key(block):
+    """Return the cache key (year and content hash) for a season block"""
+    year_match = YEAR_TEXT_PATTERN.search(block)
+    year = year_match.group(1).strip() if year_match else ''
+    return f"{year}:{hashlib.sha256(block.encode('utf-8')).hexdigest()}"
+
+def iter_seasons_cached(source, cache, engine='stream'):
+    """Yield (year, rows) per season, only running the engine on blocks not in the cache"""
+    for block in iter_season_blocks(source):
+        key = season_block_key(block)
+        found, season = cache.get(key)
+        if not found:
+            season = next(iter(ENGINES[engine](io.StringIO(block))), None)
+            cache.put(key, season)
+        if season:
+            yield season
+
+def iter_seasons(source, engine='stream', cache=None):
+    """Yield (year, rows) for each season-container in page order"""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown parser engine: {engine} (expected one of {', '.join(ENGINES)})")
+    if cache is not None:
+        return iter_seasons_cached(source, cache, engine)
+    return ENGINES[engine](source)
+
+def parse_standings(source, engine='stream', cache=None):
+    """Yield a StandingRow for every team-season in the page, in page order
+
+    source is a path or an open text file containing the ESPN league history HTML.
+    Pass a SeasonCache to skip re-parsing seasons seen in an earlier run.
+    """
+    for _, rows in iter_seasons(source, engine, cache):
+        yield from rows
+
+def sort_standings(rows):
+    """Sort rows by year and team name for consistency"""
+    return sorted(rows, key=lambda row: (row.Year, row.Team))
+
+def write_standings_csv(rows, csv_filename):
+    """Write standings rows to CSV"""
+    with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(rows)
+
+def standings_summary(rows, cache=None):
+    """Return the summary counts of a set of parsed standings rows"""
+    summary = {
+        'records': len(rows),
+        'years': sorted(set(row.Year for row in rows)),
+        'teams': len(set(row.Team for row in rows))
+    }
+    if cache is not None:
+        summary['seasons_parsed'] = cache.misses
+        summary['seasons_reused'] = cache.hits
+    return summary
+
+def extract_to_csv(html_path, csv_filename, engine='stream', cache_path=None):
+    """Parse the HTML page, write the sorted rows to CSV and log a summary"""
+    cache = SeasonCache(cache_path) if cache_path else None
+    all_standings = []
+    for year, rows in iter_seasons(html_path, engine, cache):
+        logger.debug(f"Processing year: {year}")
+        all_standings.extend(rows)
+
+    if cache:
+        cache.save()
+        logger.info(f"Season cache: {cache.misses} parsed, {cache.hits} reused")
+
+    all_standings = sort_standings(all_standings)
+
+    # Write to CSV
+    write_standings_csv(all_standings, csv_filename)
+
+    summary = standings_summary(all_standings, cache)
+    logger.info(f"\nData extraction complete!")
+    logger.info(f"Total records: {summary['records']}")
+    logger.info(f"Years covered: {summary['years']}")
+    logger.info(f"CSV file saved as: {csv_filename}")
+
+    # Display a sample of the data
+    logger.debug("\nSample data:")
+    for row in all_standings[:10]:
+        logger.debug(f"{row.Year}: #{row.Rank} {row.Team} - {row.Wins}-{row.Losses}-{row.Ties}")
+
+    log_summary(logger, 'extract', dict(summary, output=csv_filename))
+    return all_standings
+
+def season_cache_path(csv_filename):
+    """Return the season cache file kept next to a standings CSV"""
+    path = Path(csv_filename)
+    return str(path.with_name(f".{path.stem}.seasons.json"))
+
+def engine_from_args(args):
+    """Pick the parser engine from command line flags (--soup, --lxml, --htmlparser)"""
+    for engine in ENGINES:
+        if f'--{engine}' in args:
+            return engine
+    return 'stream'
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Download the pinned Chart.js build into vendor/ so the reports can self-host it
+
+The Pages deploy runs this before generating the reports, so the published
+pages load Chart.js from the site itself. Run it locally (and again after
+bumping CHARTJS_VERSION in report_engine.py) to get pages that work offline;
+report generation itself never touches the network. The download is checked
+against CHARTJS_INTEGRITY; while that is unset, the printed value is the one
+to pin there.
+
+Usage: python3 vendor_chartjs.py
+"""
+
+import sys
+import urllib.request
+
+from report_engine import CHARTJS_CDN_URL, CHARTJS_INTEGRITY, CHARTJS_PATH, CHARTJS_VERSION, subresource_integrity
+
+def main():
+    print(f"Downloading Chart.js {CHARTJS_VERSION} from {CHARTJS_CDN_URL}...")
+    try:
+        with urllib.request.urlopen(CHARTJS_CDN_URL, timeout=30) as response:
+            content = response.read()
+    except OSError as e:
+        print(f"❌ Error downloading Chart.js: {e}")
+        sys.exit(1)
+
+    integrity = subresource_integrity(content)
+    if CHARTJS_INTEGRITY and integrity != CHARTJS_INTEGRITY:
+        print(f"❌ Chart.js download does not match CHARTJS_INTEGRITY: got {integrity}")
+        sys.exit(1)
+
+    CHARTJS_PATH.parent.mkdir(exist_ok=True)
+    CHARTJS_PATH.write_bytes(content)
+    print(f"✅ Saved {CHARTJS_PATH} ({len(content):,} bytes)")
+    if CHARTJS_INTEGRITY:
+        print(f"🔒 Integrity matches the pinned {integrity}")
+    else:
+        print(f"🔒 Integrity: {integrity} (pin it as CHARTJS_INTEGRITY in report_engine.py)")
+
+if __name__ == "__main__":
+    main()